@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 _META_PREFIXES = (".github/", ".os/")
-_META_FILES = (".editorconfig", ".gitattributes", ".gitignore", "README.md", "AGENTS.md")
+_META_FILES = frozenset({".editorconfig", ".gitattributes", ".gitignore", "README.md", "AGENTS.md"})
 _REQUIRED_CHANGE_FILES = (
     "acceptance.md",
     "assumptions.md",
@@ -31,7 +31,7 @@ class _GitDiff:
 
 def _run_git(args: list[str]) -> str:
     completed = subprocess.run(
-        ["git", *args],
+        ["git", "--no-pager", *args],
         check=True,
         capture_output=True,
         text=True,
@@ -46,11 +46,12 @@ def _repo_root() -> Path:
     return Path(root)
 
 
+def _split_nul(out: str) -> tuple[str, ...]:
+    return tuple(p for p in out.split("\0") if p != "")
+
+
 def _list_tree_paths(ref: str) -> tuple[str, ...]:
-    out = _run_git(["ls-tree", "-r", "--name-only", ref]).strip()
-    if out == "":
-        return ()
-    return tuple(line.strip() for line in out.splitlines() if line.strip() != "")
+    return _split_nul(_run_git(["ls-tree", "-r", "-z", "--name-only", ref]))
 
 
 def _diff_paths(base: str, head: str) -> _GitDiff:
@@ -58,8 +59,7 @@ def _diff_paths(base: str, head: str) -> _GitDiff:
         raise RuntimeError("Missing --base/--head.")
     if base == "0" * 40:
         return _GitDiff(base=base, head=head, paths=_list_tree_paths(head))
-    out = _run_git(["diff", "--name-only", f"{base}...{head}"]).strip()
-    paths = () if out == "" else tuple(line.strip() for line in out.splitlines() if line.strip() != "")
+    paths = _split_nul(_run_git(["diff", "-z", "--name-only", f"{base}...{head}"]))
     return _GitDiff(base=base, head=head, paths=paths)
 
 
@@ -70,12 +70,8 @@ def _is_meta_path(path: str) -> bool:
 
 
 def _change_ids_from_paths(paths: Iterable[str]) -> set[str]:
-    ids: set[str] = set()
-    for p in paths:
-        parts = p.split("/")
-        if len(parts) >= 3 and parts[0] == "changes":
-            ids.add(parts[1])
-    return ids
+    prefix = "changes/"
+    return {p.split("/", 2)[1] for p in paths if p.startswith(prefix) and "/" in p[len(prefix) :]}
 
 
 def _validate_change_folder(root: Path, change_id: str) -> list[str]:
@@ -93,7 +89,6 @@ def main() -> int:
     parser.add_argument("--head", required=True)
     args = parser.parse_args()
 
-    root = _repo_root()
     diff = _diff_paths(base=args.base, head=args.head)
 
     substantive = [p for p in diff.paths if not _is_meta_path(p) and not p.startswith("changes/")]
@@ -110,6 +105,7 @@ def main() -> int:
         )
         return 2
 
+    root = _repo_root()
     missing: list[str] = []
     for change_id in sorted(change_ids):
         missing.extend(_validate_change_folder(root=root, change_id=change_id))
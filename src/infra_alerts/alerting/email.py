@@ -12,21 +12,36 @@ class EmailClient:
         self.sender = sender
         self.app_password = app_password
         self.recipients = recipients
+        self._to = ", ".join(recipients)
 
-    async def send_alert(self, payload: AlertPayload) -> bool:
+    async def send_many(self, payloads: list[AlertPayload]) -> list[bool]:
+        if not payloads:
+            return []
+        messages = [self._build_message(payload) for payload in payloads]
+        return await asyncio.to_thread(self._send_many, messages)
+
+    def _build_message(self, payload: AlertPayload) -> EmailMessage:
         subject = f"[Verefy Infra Alert] {payload.level}: {payload.title}"
         body = payload.body
         if payload.links:
             body = f"{body}\n\n" + "\n".join(payload.links)
         message = EmailMessage()
         message["From"] = self.sender
-        message["To"] = ", ".join(self.recipients)
+        message["To"] = self._to
         message["Subject"] = subject
         message.set_content(body)
-        return await asyncio.to_thread(self._send, message)
+        return message
 
-    def _send(self, message: EmailMessage) -> bool:
+    def _send_many(self, messages: list[EmailMessage]) -> list[bool]:
+        results: list[bool] = []
         with smtplib.SMTP_SSL("smtp.gmail.com", 465, timeout=15) as smtp:
             smtp.login(self.sender, self.app_password)
-            smtp.send_message(message)
-        return True
+            for message in messages:
+                try:
+                    smtp.send_message(message)
+                # SMTPException is an OSError; a dropped connection must not fail messages already sent.
+                except OSError:
+                    results.append(False)
+                    continue
+                results.append(True)
+        return results
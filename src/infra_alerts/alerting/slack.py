@@ -1,15 +1,39 @@
 from __future__ import annotations
 
+import asyncio
+
 import httpx
 
+from infra_alerts.fetcher import backoff_seconds, retry_after_seconds
 from infra_alerts.models import AlertPayload
 
 
 class SlackClient:
-    def __init__(self, webhook_url: str) -> None:
+    def __init__(
+        self,
+        webhook_url: str,
+        timeout_seconds: float = 10.0,
+        rate_limit_retries: int = 3,
+        max_backoff_seconds: float = 30.0,
+    ) -> None:
         self.webhook_url = webhook_url
+        self.timeout_seconds = timeout_seconds
+        self.rate_limit_retries = rate_limit_retries
+        self.max_backoff_seconds = max_backoff_seconds
+        self._client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> SlackClient:
+        self._client = httpx.AsyncClient(timeout=self.timeout_seconds)
+        return self
+
+    async def __aexit__(self, exc_type: object, exc: object, tb: object) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def send(self, payload: AlertPayload) -> bool:
+        if self._client is None:
+            raise RuntimeError("SlackClient must be used as an async context manager")
         body_lines = [payload.body]
         if payload.links:
             body_lines.append("\n".join(payload.links))
@@ -38,6 +62,11 @@ class SlackClient:
             }
             blocks.append(context_block)
         request_body: dict[str, object] = {"text": f"{payload.title}\n{text}", "blocks": blocks}
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(self.webhook_url, json=request_body)
+        # Webhooks are limited to about one message per second; a 429 is retried after Retry-After.
+        response = await self._client.post(self.webhook_url, json=request_body)
+        for attempt in range(self.rate_limit_retries):
+            if response.status_code != 429:
+                break
+            await asyncio.sleep(backoff_seconds(attempt, self.max_backoff_seconds, retry_after_seconds(response)))
+            response = await self._client.post(self.webhook_url, json=request_body)
         return 200 <= response.status_code < 300
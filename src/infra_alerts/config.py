@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 
 from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -81,20 +81,20 @@ class Settings(BaseSettings):
                 )
         return self
 
-    @property
+    @cached_property
     def email_recipients(self) -> list[str]:
         return [item.strip() for item in self.alert_email_recipients.split(",") if item.strip()]
 
-    @property
+    @cached_property
     def retry_minutes(self) -> list[int]:
         values = [chunk.strip() for chunk in self.retry_plan_minutes.split(",") if chunk.strip()]
         return [int(item) for item in values]
 
-    @property
+    @cached_property
     def sitemap_include_patterns(self) -> list[str]:
         return [item.strip() for item in self.twitterapi_sitemap_include_patterns.split(",") if item.strip()]
 
-    @property
+    @cached_property
     def sitemap_exclude_patterns(self) -> list[str]:
         return [item.strip() for item in self.twitterapi_sitemap_exclude_patterns.split(",") if item.strip()]
 
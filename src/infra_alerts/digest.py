@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections import Counter
+from collections import Counter, deque
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -12,29 +12,43 @@ def _parse_iso(value: str) -> datetime:
     return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
 
 
-def build_daily_digest(state: dict[str, Any], now: datetime) -> AlertPayload:
-    digest = state.get("digest", {})
-    changes_raw = digest.get("changes", [])
-    failed_raw = digest.get("failed_checks", [])
+def _is_recent(occurred_at: str, cutoff: datetime, cutoff_iso: str) -> bool:
+    # UTC timestamps from datetime.isoformat() sort lexicographically, so they skip parsing.
+    if occurred_at.endswith("+00:00"):
+        return occurred_at >= cutoff_iso
+    return _parse_iso(occurred_at) >= cutoff
+
 
-    changes = [item for item in changes_raw if isinstance(item, dict) and isinstance(item.get("occurred_at"), str)]
-    failed = [item for item in failed_raw if isinstance(item, dict) and isinstance(item.get("occurred_at"), str)]
+def _count_recent_by_target(items: Any, cutoff: datetime) -> Counter[str]:
+    cutoff_iso = cutoff.astimezone(UTC).isoformat()
+    counter: Counter[str] = Counter()
+    if not isinstance(items, list | deque):
+        return counter
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        occurred_at = item.get("occurred_at")
+        if not isinstance(occurred_at, str) or not _is_recent(occurred_at, cutoff, cutoff_iso):
+            continue
+        counter[item.get("target", "unknown")] += 1
+    return counter
 
+
+def build_daily_digest(state: dict[str, Any], now: datetime) -> AlertPayload:
+    digest = state.get("digest", {})
     cutoff = now - timedelta(hours=24)
-    recent_changes = [item for item in changes if _parse_iso(str(item["occurred_at"])) >= cutoff]
-    recent_failed = [item for item in failed if _parse_iso(str(item["occurred_at"])) >= cutoff]
+    counter = _count_recent_by_target(digest.get("changes", []), cutoff)
+    failed_targets = _count_recent_by_target(digest.get("failed_checks", []), cutoff)
 
-    if not recent_changes and not recent_failed:
+    if not counter and not failed_targets:
         body = "✅ All quiet — 0 changes detected across 8 targets in the last 24h"
     else:
-        counter = Counter(item.get("target", "unknown") for item in recent_changes)
         lines = [f"{target}: {count}" for target, count in sorted(counter.items())]
-        failed_targets = Counter(item.get("target", "unknown") for item in recent_failed)
         failed_lines = [f"{target}: {count}" for target, count in sorted(failed_targets.items())]
 
         body_parts = [
             "Last 24h summary:",
-            f"- total changes: {len(recent_changes)}",
+            f"- total changes: {counter.total()}",
             f"- alerts sent: {int(digest.get('alerts_sent', 0))}",
         ]
         if lines:
@@ -43,7 +57,7 @@ def build_daily_digest(state: dict[str, Any], now: datetime) -> AlertPayload:
             body_parts.append("- failed checks: " + ", ".join(failed_lines))
         body = "\n".join(body_parts)
 
-    return AlertPayload(
+    return AlertPayload.model_construct(
         alert_id=f"daily-digest-{now.date().isoformat()}",
         source="daily_digest",
         level="info",
@@ -1,19 +1,49 @@
 from __future__ import annotations
 
 import asyncio
+import random
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 import httpx
+from pydantic_core import from_json
 
 
 class FetchError(Exception):
     pass
 
 
+def retry_after_seconds(response: httpx.Response) -> float | None:
+    raw = response.headers.get("retry-after")
+    if raw is None or raw.strip() == "":
+        return None
+    value = raw.strip()
+    # isdigit() also accepts superscripts such as "²", which float() rejects.
+    if value.isascii() and value.isdecimal():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+def backoff_seconds(attempt: int, max_backoff_seconds: float, retry_after: float | None = None) -> float:
+    # Full jitter spreads concurrent retries; Retry-After (capped) is honoured as a lower bound.
+    delay = random.uniform(0, min(2**attempt, max_backoff_seconds))
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, max_backoff_seconds))
+    return delay
+
+
 class AsyncFetcher:
-    def __init__(self, timeout_seconds: float = 10.0, retries: int = 3) -> None:
+    def __init__(self, timeout_seconds: float = 10.0, retries: int = 3, max_backoff_seconds: float = 30.0) -> None:
         self.timeout_seconds = timeout_seconds
         self.retries = retries
+        self.max_backoff_seconds = max_backoff_seconds
         self._client: httpx.AsyncClient | None = None
 
     async def __aenter__(self) -> AsyncFetcher:
@@ -34,6 +64,15 @@ class AsyncFetcher:
         response = await self._request("GET", url, headers=headers, params=params)
         return response.text
 
+    async def get_bytes(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        params: dict[str, str] | None = None,
+    ) -> bytes:
+        response = await self._request("GET", url, headers=headers, params=params)
+        return response.content
+
     async def get_json(
         self,
         url: str,
@@ -41,7 +80,18 @@ class AsyncFetcher:
         params: dict[str, str] | None = None,
     ) -> Any:
         response = await self._request("GET", url, headers=headers, params=params)
-        return response.json()
+        return from_json(response.content)
+
+    async def get_json_with_response(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        params: dict[str, str] | None = None,
+    ) -> tuple[Any, httpx.Response]:
+        response = await self._request("GET", url, headers=headers, params=params)
+        if response.status_code == 304:
+            return None, response
+        return from_json(response.content), response
 
     async def post_json(
         self,
@@ -50,7 +100,7 @@ class AsyncFetcher:
         json_payload: dict[str, Any] | None = None,
     ) -> Any:
         response = await self._request("POST", url, headers=headers, json_payload=json_payload)
-        return response.json()
+        return from_json(response.content)
 
     async def _request(
         self,
@@ -65,9 +115,11 @@ class AsyncFetcher:
 
         last_error: Exception | None = None
         for attempt in range(self.retries):
+            retry_after: float | None = None
             try:
                 response = await self._client.request(method, url, headers=headers, params=params, json=json_payload)
                 if response.status_code >= 500 or response.status_code == 429:
+                    retry_after = retry_after_seconds(response)
                     raise FetchError(f"Transient HTTP status {response.status_code} for {url}")
                 if response.status_code >= 400:
                     raise FetchError(f"HTTP status {response.status_code} for {url}")
@@ -76,5 +128,5 @@ class AsyncFetcher:
                 last_error = exc
                 if attempt == self.retries - 1:
                     break
-                await asyncio.sleep(2**attempt)
+                await asyncio.sleep(backoff_seconds(attempt, self.max_backoff_seconds, retry_after))
         raise FetchError(str(last_error) if last_error else f"Request failed for {url}")
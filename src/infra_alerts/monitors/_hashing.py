@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import hashlib
+
+FINGERPRINT_PREFIX = "blake2b:"
+DIGEST_BYTES = 16
+
+
+def digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=DIGEST_BYTES).digest()
+
+
+def fingerprint(text: str) -> str:
+    return FINGERPRINT_PREFIX + digest(text).hex()
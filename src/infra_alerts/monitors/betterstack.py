@@ -19,6 +19,7 @@ async def fetch_monitor_statuses(fetcher: AsyncFetcher, api_token: str) -> dict[
     statuses: dict[str, str] = {}
 
     next_url: str | None = endpoint
+    seen_urls: set[str] = {endpoint}
     pages = 0
     while next_url is not None and pages < 10:
         payload = await fetcher.get_json(next_url, headers=headers)
@@ -37,6 +38,8 @@ async def fetch_monitor_statuses(fetcher: AsyncFetcher, api_token: str) -> dict[
                 if not isinstance(monitor_status, str):
                     continue
                 statuses[identifier] = normalize_monitor_status(monitor_status)
+        if not data:
+            break
 
         next_link: str | None = None
         pagination = payload.get("pagination") if isinstance(payload, dict) else None
@@ -44,6 +47,10 @@ async def fetch_monitor_statuses(fetcher: AsyncFetcher, api_token: str) -> dict[
             raw_next = pagination.get("next")
             if isinstance(raw_next, str) and raw_next.strip():
                 next_link = raw_next.strip()
+        if next_link is not None:
+            if next_link in seen_urls:
+                break
+            seen_urls.add(next_link)
         next_url = next_link
 
     return statuses
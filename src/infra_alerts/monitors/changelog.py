@@ -1,43 +1,54 @@
 from __future__ import annotations
 
-import hashlib
 import re
+from collections.abc import Iterator
 from datetime import datetime
+from itertools import islice
 from typing import Any
 
 from selectolax.parser import HTMLParser
 
 from infra_alerts.fetcher import AsyncFetcher
 from infra_alerts.models import ChangeEvent, CheckResult
+from infra_alerts.monitors._hashing import DIGEST_BYTES, digest
 
 MONTH_RE = r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*"
-DATE_PATTERNS = [
-    re.compile(rf"{MONTH_RE}\s+\d{{1,2}},\s+\d{{4}}", re.IGNORECASE),
-    re.compile(r"\d{4}-\d{2}-\d{2}"),
-    re.compile(r"\d{1,2}/\d{1,2}/\d{4}"),
-]
+DATE_RE = re.compile(
+    rf"(?:{MONTH_RE}\s+\d{{1,2}},\s+\d{{4}})|(?:\d{{4}}-\d{{2}}-\d{{2}})|(?:\d{{1,2}}/\d{{1,2}}/\d{{4}})",
+    re.IGNORECASE,
+)
+WHITESPACE_RE = re.compile(r"\s+")
+ENTRY_PREFIXES = ("release", "update", "change", "changelog", "new ")
+MAX_CANDIDATE_LINES = 120
+FALLBACK_LINES = 40
 
 
 def _line_id(line: str) -> str:
-    return hashlib.sha256(line.encode("utf-8")).hexdigest()
+    return digest(line).hex()
+
+
+def _page_hash(html: str) -> str:
+    return digest(html).hex()
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    for raw in text.splitlines():
+        line = WHITESPACE_RE.sub(" ", raw).strip()
+        if len(line) >= 6:
+            yield line
+
+
+def _is_candidate(line: str) -> bool:
+    return DATE_RE.search(line) is not None or line.lower().startswith(ENTRY_PREFIXES)
 
 
 def _extract_candidate_lines(html: str) -> list[str]:
     tree = HTMLParser(html)
     text = tree.body.text(separator="\n") if tree.body is not None else tree.text()
-    lines = [re.sub(r"\s+", " ", line).strip() for line in text.splitlines()]
-    lines = [line for line in lines if line and len(line) >= 6]
-
-    selected: list[str] = []
-    for line in lines:
-        if any(pattern.search(line) for pattern in DATE_PATTERNS):
-            selected.append(line)
-            continue
-        if line.lower().startswith(("release", "update", "change", "changelog", "new ")):
-            selected.append(line)
+    selected = list(islice(filter(_is_candidate, _iter_lines(text)), MAX_CANDIDATE_LINES))
     if not selected:
-        selected = lines[:40]
-    return selected[:120]
+        selected = list(islice(_iter_lines(text), FALLBACK_LINES))
+    return selected
 
 
 async def check_changelog(
@@ -48,25 +59,31 @@ async def check_changelog(
     now: datetime,
 ) -> CheckResult:
     html = await fetcher.get_text(url)
-    entries = _extract_candidate_lines(html)
-    entry_ids = [_line_id(entry) for entry in entries]
+    page_hash = _page_hash(html)
     previous_ids_raw = previous_state.get("entry_ids", [])
     previous_ids = [str(item) for item in previous_ids_raw] if isinstance(previous_ids_raw, list) else []
+    # Ids written by an older hash function can never match; drop them so the page is re-baselined silently.
+    previous_ids = [item for item in previous_ids if len(item) == DIGEST_BYTES * 2]
+
+    if previous_ids and previous_state.get("page_hash") == page_hash:
+        return CheckResult(target=target, events=[], state_update={"last_checked": now.isoformat()})
 
+    entries = _extract_candidate_lines(html)
+    entry_ids = [_line_id(entry) for entry in entries]
     if not previous_ids:
         return CheckResult(
             target=target,
             events=[],
-            state_update={"entry_ids": entry_ids[:200], "last_checked": now.isoformat()},
+            state_update={"entry_ids": entry_ids[:200], "page_hash": page_hash, "last_checked": now.isoformat()},
         )
 
-    seen = set(previous_ids)
-    new_entries = [entry for entry in entries if _line_id(entry) not in seen]
+    seen = frozenset(previous_ids)
+    new_entries = [entry for entry, entry_id in zip(entries, entry_ids, strict=True) if entry_id not in seen]
 
     events: list[ChangeEvent] = []
     for entry in new_entries[:20]:
         events.append(
-            ChangeEvent(
+            ChangeEvent.model_construct(
                 target=target,
                 summary=entry,
                 link=url,
@@ -79,5 +96,5 @@ async def check_changelog(
     return CheckResult(
         target=target,
         events=events,
-        state_update={"entry_ids": entry_ids[:200], "last_checked": now.isoformat()},
+        state_update={"entry_ids": entry_ids[:200], "page_hash": page_hash, "last_checked": now.isoformat()},
     )
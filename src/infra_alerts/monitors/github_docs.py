@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from typing import Any
 
 from infra_alerts.fetcher import AsyncFetcher
 from infra_alerts.models import ChangeEvent, CheckResult
 
+# Cap in-flight commit-detail requests to stay under GitHub's secondary rate limits.
+DETAIL_CONCURRENCY = 8
+
 
 def _headers(token: str | None) -> dict[str, str]:
     headers = {
@@ -26,22 +30,30 @@ async def check_github_docs(
     now: datetime,
 ) -> CheckResult:
     commits_endpoint = f"https://api.github.com/repos/{repo}/commits"
-    commits_payload = await fetcher.get_json(
+    previous_sha = str(previous_state.get("last_commit_sha", ""))
+    list_headers = _headers(github_token)
+    previous_etag = previous_state.get("commits_etag")
+    if previous_sha != "" and isinstance(previous_etag, str) and previous_etag:
+        list_headers["If-None-Match"] = previous_etag
+    commits_payload, response = await fetcher.get_json_with_response(
         commits_endpoint,
-        headers=_headers(github_token),
+        headers=list_headers,
         params={"per_page": "20"},
     )
+    if response.status_code == 304:
+        return CheckResult(target=target, events=[], state_update={"last_checked": now.isoformat()})
+    etag = response.headers.get("etag")
+
     commits = commits_payload if isinstance(commits_payload, list) else []
     if not commits:
         return CheckResult(target=target, events=[], state_update={"last_checked": now.isoformat()})
 
     latest_sha = str(commits[0].get("sha", ""))
-    previous_sha = str(previous_state.get("last_commit_sha", ""))
     if previous_sha == "":
         return CheckResult(
             target=target,
             events=[],
-            state_update={"last_commit_sha": latest_sha, "last_checked": now.isoformat()},
+            state_update={"last_commit_sha": latest_sha, "commits_etag": etag, "last_checked": now.isoformat()},
         )
 
     new_commits: list[dict[str, Any]] = []
@@ -51,15 +63,27 @@ async def check_github_docs(
             break
         new_commits.append(commit)
 
+    ordered_commits = list(reversed(new_commits))
+    semaphore = asyncio.Semaphore(DETAIL_CONCURRENCY)
+
+    async def fetch_details(sha: str) -> Any:
+        async with semaphore:
+            return await fetcher.get_json(
+                f"https://api.github.com/repos/{repo}/commits/{sha}",
+                headers=_headers(github_token),
+            )
+
+    details_list = await asyncio.gather(
+        *(fetch_details(str(commit.get("sha", ""))) for commit in ordered_commits),
+        return_exceptions=True,
+    )
+    for details in details_list:
+        if isinstance(details, BaseException):
+            raise details
+
     events: list[ChangeEvent] = []
-    for commit in reversed(new_commits):
+    for commit, details in zip(ordered_commits, details_list, strict=True):
         sha = str(commit.get("sha", ""))
-        if sha == "":
-            continue
-        details = await fetcher.get_json(
-            f"https://api.github.com/repos/{repo}/commits/{sha}",
-            headers=_headers(github_token),
-        )
         files_raw = details.get("files") if isinstance(details, dict) else None
         changed_files: list[str] = []
         if isinstance(files_raw, list):
@@ -76,7 +100,7 @@ async def check_github_docs(
             summary = f"{summary} | files: {', '.join(changed_files[:3])}"
         html_url = str(commit.get("html_url", "")) or None
         events.append(
-            ChangeEvent(
+            ChangeEvent.model_construct(
                 target=target,
                 summary=summary,
                 link=html_url,
@@ -90,5 +114,5 @@ async def check_github_docs(
     return CheckResult(
         target=target,
         events=events,
-        state_update={"last_commit_sha": latest_sha, "last_checked": now.isoformat()},
+        state_update={"last_commit_sha": latest_sha, "commits_etag": etag, "last_checked": now.isoformat()},
     )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-import hashlib
+import asyncio
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 from xml.etree import ElementTree
@@ -9,41 +10,67 @@ from selectolax.parser import HTMLParser
 
 from infra_alerts.fetcher import AsyncFetcher
 from infra_alerts.models import ChangeEvent, CheckResult
+from infra_alerts.monitors._hashing import FINGERPRINT_PREFIX, fingerprint
+
+SITEMAP_FEED_CHUNK = 64 * 1024
+PAGE_FETCH_CONCURRENCY = 8
+MAX_FETCHED_PAGES = 40
+
+
+def _read_sitemap_events(
+    parser: ElementTree.XMLPullParser[ElementTree.Element], xml_text: str
+) -> Iterator[tuple[str, ElementTree.Element]]:
+    def drain() -> Iterator[tuple[str, ElementTree.Element]]:
+        for item in parser.read_events():
+            element = item[-1]
+            if isinstance(element, ElementTree.Element):
+                yield item[0], element
+
+    for offset in range(0, len(xml_text), SITEMAP_FEED_CHUNK):
+        parser.feed(xml_text[offset : offset + SITEMAP_FEED_CHUNK])
+        yield from drain()
+    parser.close()
+    yield from drain()
 
 
 def _parse_sitemap(xml_text: str) -> dict[str, str]:
-    root = ElementTree.fromstring(xml_text)
+    # Stream the document and drop each <url> once read, so the tree never holds the whole sitemap.
+    parser: ElementTree.XMLPullParser[ElementTree.Element] = ElementTree.XMLPullParser(events=("start", "end"))
     loc_to_lastmod: dict[str, str] = {}
+    root: ElementTree.Element | None = None
     namespace = ""
-    if root.tag.startswith("{") and "}" in root.tag:
-        namespace = root.tag.split("}", maxsplit=1)[0] + "}"
-    for url in root.findall(f"{namespace}url"):
-        loc_node = url.find(f"{namespace}loc")
-        if loc_node is None or loc_node.text is None:
+    depth = 0
+    for event, element in _read_sitemap_events(parser, xml_text):
+        if event == "start":
+            depth += 1
+            if root is None:
+                root = element
+                if element.tag.startswith("{") and "}" in element.tag:
+                    namespace = element.tag.split("}", maxsplit=1)[0] + "}"
             continue
-        lastmod_node = url.find(f"{namespace}lastmod")
-        loc = loc_node.text.strip()
-        lastmod = lastmod_node.text.strip() if lastmod_node is not None and lastmod_node.text else ""
+        depth -= 1
+        if depth != 1 or element.tag != f"{namespace}url" or root is None:
+            continue
+        loc = (element.findtext(f"{namespace}loc") or "").strip()
+        lastmod = (element.findtext(f"{namespace}lastmod") or "").strip()
         if loc:
             loc_to_lastmod[loc] = lastmod
+        root.clear()
     return loc_to_lastmod
 
 
 def _summarize_page(html: str) -> str:
     parser = HTMLParser(html)
-    title = parser.css_first("title")
-    heading = parser.css_first("h1")
-    title_text = title.text(strip=True) if title is not None else ""
-    heading_text = heading.text(strip=True) if heading is not None else ""
+    # Plain tag lookups skip selectolax's CSS selector compilation.
+    titles = parser.tags("title")
+    headings = parser.tags("h1")
+    title_text = titles[0].text(strip=True) if titles else ""
+    heading_text = headings[0].text(strip=True) if headings else ""
     if title_text and heading_text and title_text != heading_text:
         return f"{title_text} | {heading_text}"
     return title_text or heading_text or "(no title)"
 
 
-def _hash_text(value: str) -> str:
-    return hashlib.sha256(value.encode("utf-8")).hexdigest()
-
-
 def _matches_patterns(url: str, include_patterns: list[str], exclude_patterns: list[str]) -> bool:
     lowered = url.lower()
     if include_patterns and not any(pattern.lower() in lowered for pattern in include_patterns):
@@ -70,11 +97,15 @@ async def check_sitemap(
         if _matches_patterns(url, include_patterns=include_patterns, exclude_patterns=exclude_patterns)
     }
 
+    now_iso = now.isoformat()
     previous_map_raw = previous_state.get("page_lastmods", {})
     previous_map = previous_map_raw if isinstance(previous_map_raw, dict) else {}
     previous_hashes_raw = previous_state.get("page_hashes", {})
     previous_hashes = previous_hashes_raw if isinstance(previous_hashes_raw, dict) else {}
 
+    previous_summaries_raw = previous_state.get("page_summaries", {})
+    previous_summaries = previous_summaries_raw if isinstance(previous_summaries_raw, dict) else {}
+
     if not previous_map:
         return CheckResult(
             target=target,
@@ -82,38 +113,47 @@ async def check_sitemap(
             state_update={
                 "page_lastmods": filtered_map,
                 "page_hashes": previous_hashes,
-                "last_checked": now.isoformat(),
+                "last_checked": now_iso,
             },
         )
 
-    changed_urls: list[str] = []
-    for url, lastmod in filtered_map.items():
-        if url not in previous_map or previous_map.get(url) != lastmod:
-            changed_urls.append(url)
+    # The view difference runs in C; walking filtered_map again only when something changed keeps sitemap order.
+    changed_pairs = filtered_map.items() - previous_map.items()
+    changed_urls = (
+        (url for url, lastmod in filtered_map.items() if (url, lastmod) in changed_pairs) if changed_pairs else ()
+    )
+
+    semaphore = asyncio.Semaphore(PAGE_FETCH_CONCURRENCY)
 
-    events: list[ChangeEvent] = []
-    updated_hashes = dict(previous_hashes)
-    for url in changed_urls[:40]:
-        try:
+    async def fetch_summary(url: str) -> tuple[str, str]:
+        async with semaphore:
             page_html = await fetcher.get_text(url)
-            summary = _summarize_page(page_html)
-            content_hash = _hash_text(summary)
-            if updated_hashes.get(url) == content_hash:
-                continue
-            updated_hashes[url] = content_hash
-            events.append(
-                ChangeEvent(
-                    target=target,
-                    summary=f"Updated page: {summary}",
-                    link=url,
-                    severity="info",
-                    occurred_at=now,
-                    kind="sitemap_change",
-                )
-            )
-        except Exception:
+        # Summarise and hash as each page lands, while the other fetches are still waiting on the network.
+        summary = _summarize_page(page_html)
+        return summary, fingerprint(summary)
+
+    hash_deltas: dict[str, str] = {}
+    summary_deltas: dict[str, dict[str, str]] = {}
+    pending_urls: list[str] = []
+    for url in changed_urls:
+        cached = previous_summaries.get(url)
+        # This exact revision was summarised on an earlier run; nothing new to fetch or report.
+        if isinstance(cached, dict) and cached.get("lastmod") == filtered_map[url] and cached.get("hash"):
+            hash_deltas[url] = str(cached["hash"])
+            continue
+        pending_urls.append(url)
+        if len(pending_urls) == MAX_FETCHED_PAGES:
+            break
+
+    fetched = await asyncio.gather(*(fetch_summary(url) for url in pending_urls), return_exceptions=True)
+
+    events: list[ChangeEvent] = []
+    for url, outcome in zip(pending_urls, fetched, strict=True):
+        if isinstance(outcome, BaseException):
+            if not isinstance(outcome, Exception):
+                raise outcome
             events.append(
-                ChangeEvent(
+                ChangeEvent.model_construct(
                     target=target,
                     summary="Updated page detected but content fetch failed",
                     link=url,
@@ -122,13 +162,38 @@ async def check_sitemap(
                     kind="sitemap_change_fetch_failed",
                 )
             )
+            continue
+        summary, content_hash = outcome
+        summary_deltas[url] = {"lastmod": filtered_map[url], "hash": content_hash}
+        previous_hash = hash_deltas.get(url, previous_hashes.get(url))
+        if previous_hash == content_hash:
+            continue
+        hash_deltas[url] = content_hash
+        # Unprefixed hashes were written by the old sha256 fingerprint; re-baseline them without an event.
+        if previous_hash is not None and not str(previous_hash).startswith(FINGERPRINT_PREFIX):
+            continue
+        events.append(
+            ChangeEvent.model_construct(
+                target=target,
+                summary=f"Updated page: {summary}",
+                link=url,
+                severity="info",
+                occurred_at=now,
+                kind="sitemap_change",
+            )
+        )
 
+    # Only pages still in the sitemap keep a cached revision, so the map cannot outgrow it.
+    page_summaries = {
+        url: cached for url, cached in {**previous_summaries, **summary_deltas}.items() if url in filtered_map
+    }
     return CheckResult(
         target=target,
         events=events,
         state_update={
             "page_lastmods": filtered_map,
-            "page_hashes": updated_hashes,
-            "last_checked": now.isoformat(),
+            "page_hashes": {**previous_hashes, **hash_deltas},
+            "page_summaries": page_summaries,
+            "last_checked": now_iso,
         },
     )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import hashlib
+import asyncio
 import re
 from datetime import UTC, datetime
 from typing import Any
@@ -9,10 +9,28 @@ from selectolax.parser import HTMLParser
 
 from infra_alerts.fetcher import AsyncFetcher
 from infra_alerts.models import AlertLevel, ChangeEvent, CheckResult
+from infra_alerts.monitors._hashing import FINGERPRINT_PREFIX, digest, fingerprint
+
+LEGACY_HASH_PREFIX = "sha256:"
+PHASE_PHRASES: tuple[tuple[str, str], ...] = (
+    ("all systems are operational", "operational"),
+    ("all systems operational", "operational"),
+    ("active incidents 0", "operational"),
+    ("major outage", "major_outage"),
+    ("partial outage", "partial_outage"),
+    ("degraded", "degraded"),
+    ("maintenance", "maintenance"),
+    ("monitoring incident", "monitoring"),
+    ("currently monitoring", "monitoring"),
+    ("operational", "operational"),
+)
+PHASE_PRIORITY = {phrase: index for index, (phrase, _) in enumerate(PHASE_PHRASES)}
+# ASCII-only case folding, so every match lower-cases to a PHASE_PRIORITY key (as str.lower() did before).
+PHASE_RE = re.compile("|".join(re.escape(phrase) for phrase, _ in PHASE_PHRASES), re.IGNORECASE | re.ASCII)
 
 
 def _normalize_space(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
+    return " ".join(text.split())
 
 
 def _extract_text(html: str) -> str:
@@ -24,26 +42,13 @@ def _extract_text(html: str) -> str:
 
 
 def _phase_from_text(text: str) -> str:
-    lowered = text.lower()
-    if (
-        "all systems are operational" in lowered
-        or "all systems operational" in lowered
-        or "active incidents 0" in lowered
-    ):
-        return "operational"
-    if "major outage" in lowered:
-        return "major_outage"
-    if "partial outage" in lowered:
-        return "partial_outage"
-    if "degraded" in lowered:
-        return "degraded"
-    if "maintenance" in lowered:
-        return "maintenance"
-    if "monitoring incident" in lowered or "currently monitoring" in lowered:
-        return "monitoring"
-    if "operational" in lowered:
-        return "operational"
-    return "unknown"
+    # One scan over the text; the earliest entry in PHASE_PHRASES that appears anywhere wins.
+    best = len(PHASE_PHRASES)
+    for match in PHASE_RE.finditer(text):
+        best = min(best, PHASE_PRIORITY[match.group().lower()])
+        if best == 0:
+            break
+    return PHASE_PHRASES[best][1] if best < len(PHASE_PHRASES) else "unknown"
 
 
 def _level_for_phase(phase: str) -> AlertLevel:
@@ -56,10 +61,6 @@ def _level_for_phase(phase: str) -> AlertLevel:
     return "info"
 
 
-def _hash_text(text: str) -> str:
-    return "sha256:" + hashlib.sha256(text.encode("utf-8")).hexdigest()
-
-
 def _parse_iso(value: str | None) -> datetime | None:
     if value is None or value == "":
         return None
@@ -75,24 +76,43 @@ async def check_status_page(
     now: datetime,
     alert_delay_minutes: int,
 ) -> CheckResult:
-    contents: list[str] = []
-    for url in urls:
-        html = await fetcher.get_text(url)
-        contents.append(_extract_text(html))
-    merged_text = "\n".join(contents)
-    content_hash = _hash_text(merged_text)
-    phase = _phase_from_text(merged_text)
+    pages = await asyncio.gather(*(fetcher.get_text(url) for url in urls), return_exceptions=True)
+    htmls: list[str] = []
+    for html in pages:
+        if isinstance(html, BaseException):
+            raise html
+        htmls.append(html)
 
     prev_phase = str(previous_state.get("phase", "unknown"))
     prev_hash = str(previous_state.get("content_hash", ""))
+    body_hashes = {url: digest(html).hex() for url, html in zip(urls, htmls, strict=True)}
+    previous_body_hashes = previous_state.get("page_body_hashes")
+    if (
+        isinstance(previous_body_hashes, dict)
+        and list(previous_body_hashes.items()) == list(body_hashes.items())
+        and prev_hash.startswith(FINGERPRINT_PREFIX)
+        and "phase" in previous_state
+    ):
+        # Every page is byte-identical to the last check, so its text, hash and phase are too.
+        content_hash = prev_hash
+        phase = prev_phase
+    else:
+        # Parsing a large status page takes long enough to stall other checks; keep it off the event loop.
+        contents = await asyncio.gather(*(asyncio.to_thread(_extract_text, html) for html in htmls))
+        merged_text = "\n".join(contents)
+        content_hash = fingerprint(merged_text)
+        phase = _phase_from_text(merged_text)
+
     incident_alerted = bool(previous_state.get("incident_alerted", False))
     pending_since = _parse_iso(previous_state.get("pending_incident_since"))
 
+    now_iso = now.isoformat()
     events: list[ChangeEvent] = []
     state_update: dict[str, Any] = {
         "content_hash": content_hash,
         "phase": phase,
-        "last_checked": now.isoformat(),
+        "page_body_hashes": body_hashes,
+        "last_checked": now_iso,
     }
 
     phase_non_operational = phase not in {"operational", "unknown"}
@@ -101,12 +121,14 @@ async def check_status_page(
     if phase_non_operational:
         since = pending_since if pending_since is not None else now
         minutes_open = (now - since).total_seconds() / 60.0
-        state_update["pending_incident_since"] = since.isoformat()
+        state_update["pending_incident_since"] = now_iso if pending_since is None else pending_since.isoformat()
 
         if incident_alerted:
-            if phase != prev_phase or content_hash != prev_hash:
+            # A hash from the previous algorithm says nothing about content; only a phase change counts then.
+            content_changed = content_hash != prev_hash and not prev_hash.startswith(LEGACY_HASH_PREFIX)
+            if phase != prev_phase or content_changed:
                 events.append(
-                    ChangeEvent(
+                    ChangeEvent.model_construct(
                         target=target,
                         summary=f"Status update: {phase.replace('_', ' ')}",
                         link=urls[0] if urls else None,
@@ -117,7 +139,7 @@ async def check_status_page(
                 )
         elif minutes_open >= float(alert_delay_minutes):
             events.append(
-                ChangeEvent(
+                ChangeEvent.model_construct(
                     target=target,
                     summary=f"Incident detected: {phase.replace('_', ' ')}",
                     link=urls[0] if urls else None,
@@ -134,7 +156,7 @@ async def check_status_page(
         state_update["incident_alerted"] = False
         if incident_alerted or prev_non_operational:
             events.append(
-                ChangeEvent(
+                ChangeEvent.model_construct(
                     target=target,
                     summary="Service recovered and is operational",
                     link=urls[0] if urls else None,
@@ -1,36 +1,46 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from datetime import datetime
+from operator import itemgetter
 from typing import Any
 
+from pydantic_core import from_json
+
 from infra_alerts.fetcher import AsyncFetcher
 from infra_alerts.models import ChangeEvent, CheckResult
 
+TWEET_LIST_KEYS = ("tweets", "data", "results", "items")
+
 
 def _parse_tweets(payload: Any) -> list[dict[str, Any]]:
     if isinstance(payload, dict):
-        for key in ("tweets", "data", "results", "items"):
-            if isinstance(payload.get(key), list):
-                return [item for item in payload[key] if isinstance(item, dict)]
+        for key in TWEET_LIST_KEYS:
+            items = payload.get(key)
+            if isinstance(items, list):
+                return [item for item in items if isinstance(item, dict)]
     if isinstance(payload, list):
         return [item for item in payload if isinstance(item, dict)]
     return []
 
 
 def _tweet_id(value: Any) -> int | None:
-    if value is None:
-        return None
-    text = str(value).strip()
-    if text.isdigit():
-        return int(text)
-    return None
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value if value >= 0 else None
+    # Plain ASCII digits only: int() would also accept signs and underscores.
+    text = str(value).strip() if value is not None else ""
+    return int(text) if text.isascii() and text.isdecimal() else None
+
+
+def _raw_tweet_id(item: dict[str, Any]) -> Any:
+    return item.get("id") or item.get("tweet_id") or item.get("id_str")
 
 
 def _tweet_url(account: str, item: dict[str, Any]) -> str:
     possible_url = item.get("url")
     if isinstance(possible_url, str) and possible_url:
         return possible_url
-    tweet_id = item.get("id") or item.get("tweet_id") or item.get("id_str")
+    tweet_id = _raw_tweet_id(item)
     return f"https://x.com/{account}/status/{tweet_id}"
 
 
@@ -42,32 +52,31 @@ async def check_account_tweets(
     api_key: str,
     now: datetime,
 ) -> CheckResult:
-    payload = await fetcher.get_json(
+    body = await fetcher.get_bytes(
         "https://api.twitterapi.io/twitter/user/last_tweets",
         headers={"X-API-Key": api_key, "Accept": "application/json"},
         params={"userName": account, "count": "50"},
     )
-    tweets = _parse_tweets(payload)
-    tweets.sort(key=lambda item: _tweet_id(item.get("id") or item.get("tweet_id") or item.get("id_str")) or 0)
+    # Tweet objects repeat the same keys, but their values (text, ids, urls) are almost all unique.
+    payload = from_json(body, cache_strings="keys")
+    # Extract each id once; the sort then compares plain ints.
+    parsed = [
+        (tweet_id, item) for item in _parse_tweets(payload) if (tweet_id := _tweet_id(_raw_tweet_id(item))) is not None
+    ]
+    parsed.sort(key=itemgetter(0))
 
     previous_last = _tweet_id(previous_state.get("last_tweet_id"))
     current_last = previous_last
+    if parsed and (current_last is None or parsed[-1][0] > current_last):
+        current_last = parsed[-1][0]
+    # Without a baseline nothing is reported; otherwise jump straight past the ids already seen.
+    start = len(parsed) if previous_last is None else bisect_right(parsed, previous_last, key=itemgetter(0))
     new_events: list[ChangeEvent] = []
 
-    for item in tweets:
-        tweet_id = _tweet_id(item.get("id") or item.get("tweet_id") or item.get("id_str"))
-        if tweet_id is None:
-            continue
-        if current_last is None or tweet_id > current_last:
-            current_last = tweet_id
-        if previous_last is None:
-            continue
-        if tweet_id <= previous_last:
-            continue
-
+    for tweet_id, item in parsed[start:]:
         text = item.get("text") or item.get("full_text") or item.get("content") or "(no text)"
         new_events.append(
-            ChangeEvent(
+            ChangeEvent.model_construct(
                 target=target,
                 summary=f"New tweet from @{account}: {str(text)[:220]}",
                 link=_tweet_url(account, item),
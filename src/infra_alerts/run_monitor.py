@@ -2,18 +2,22 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+from collections import deque
+from collections.abc import Coroutine
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from importlib.metadata import PackageNotFoundError, version
 from typing import Any
 from zoneinfo import ZoneInfo
 
 import structlog
+from pydantic import TypeAdapter, ValidationError
 
 from infra_alerts.alerting import EmailClient, SlackClient
 from infra_alerts.config import Settings, get_settings
 from infra_alerts.digest import build_daily_digest
 from infra_alerts.fetcher import AsyncFetcher
-from infra_alerts.models import AlertLevel, AlertPayload, ChangeEvent, PendingAlert
+from infra_alerts.models import AlertLevel, AlertPayload, ChangeEvent, CheckResult, PendingAlert
 from infra_alerts.monitors import (
     check_account_tweets,
     check_changelog,
@@ -24,6 +28,25 @@ from infra_alerts.monitors import (
 )
 from infra_alerts.state import StateStore
 
+# Slack allows roughly one webhook message per second, so only a couple of posts are kept in flight.
+DELIVERY_CONCURRENCY = 2
+PHASE_LEVELS: dict[str, AlertLevel] = {
+    "major_outage": "critical",
+    "partial_outage": "critical",
+    "degraded": "critical",
+    "maintenance": "warning",
+    "monitoring": "warning",
+    "operational": "resolved",
+}
+PHASE_LABELS = {phase: phase.replace("_", " ") for phase in PHASE_LEVELS}
+PENDING_ALERTS = TypeAdapter(list[PendingAlert])
+LEVEL_EMOJI: dict[AlertLevel, str] = {
+    "critical": "🔴",
+    "warning": "⚠️",
+    "info": "📝",
+    "resolved": "🟢",
+}
+
 
 def configure_logging() -> None:
     structlog.configure(
@@ -39,6 +62,7 @@ def utc_now() -> datetime:
     return datetime.now(UTC)
 
 
+@lru_cache(maxsize=128)
 def parse_iso(value: str | None) -> datetime | None:
     if value is None or value == "":
         return None
@@ -54,13 +78,7 @@ def should_run(last_checked: str | None, interval_minutes: int, now: datetime) -
 
 
 def phase_to_level(phase: str) -> AlertLevel:
-    if phase in {"major_outage", "partial_outage", "degraded"}:
-        return "critical"
-    if phase in {"maintenance", "monitoring"}:
-        return "warning"
-    if phase == "operational":
-        return "resolved"
-    return "info"
+    return PHASE_LEVELS.get(phase, "info")
 
 
 def is_backup_non_operational(phase: str) -> bool:
@@ -80,8 +98,9 @@ def primary_monitor_id_for_target(settings: Settings, target_key: str) -> str |
 
 
 def build_alert_id(source: str, summary: str, timestamp: datetime) -> str:
-    raw = f"{source}|{summary}|{timestamp.replace(second=0, microsecond=0).isoformat()}"
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:24]
+    minute = timestamp.replace(second=0, microsecond=0).isoformat()
+    # Ids are persisted for cross-run dedup, so the hashed bytes must stay exactly as they were.
+    return hashlib.sha256(f"{source}|{summary}|{minute}".encode()).digest()[:12].hex()
 
 
 def current_app_version() -> str:
@@ -122,15 +141,9 @@ def version_transition_alert(
 
 
 def event_to_alert(event: ChangeEvent) -> AlertPayload:
-    emoji_by_level = {
-        "critical": "🔴",
-        "warning": "⚠️",
-        "info": "📝",
-        "resolved": "🟢",
-    }
-    prefix = emoji_by_level[event.severity]
+    prefix = LEVEL_EMOJI[event.severity]
     title = f"{prefix} {event.target}"
-    return AlertPayload(
+    return AlertPayload.model_construct(
         alert_id=build_alert_id(event.target, event.summary, event.occurred_at),
         source=event.target,
         level=event.severity,
@@ -142,19 +155,37 @@ def event_to_alert(event: ChangeEvent) -> AlertPayload:
     )
 
 
+def load_pending_models(pending_raw: list[Any], log: structlog.stdlib.BoundLogger) -> list[PendingAlert]:
+    # Validate the whole queue in one pydantic call; only a bad entry forces the per-item pass.
+    try:
+        return PENDING_ALERTS.validate_python(pending_raw)
+    except ValidationError:
+        pass
+    pending_models: list[PendingAlert] = []
+    for pending_raw_item in pending_raw:
+        try:
+            pending_models.append(PendingAlert.model_validate(pending_raw_item))
+        except Exception:
+            log.warning("invalid_pending_alert_dropped", pending=pending_raw_item)
+    return pending_models
+
+
 def group_tweet_alert(events: list[ChangeEvent], now: datetime, max_links: int) -> AlertPayload | None:
     if not events:
         return None
     sorted_events = sorted(events, key=lambda item: item.occurred_at)
-    links = [event.link for event in sorted_events if event.link is not None]
-    links = links[:max_links]
-    accounts = sorted({str(event.metadata.get("account", "unknown")) for event in sorted_events})
-    account_label = ", ".join("@" + account for account in accounts)
+    links: list[str] = []
+    accounts: set[str] = set()
+    for event in sorted_events:
+        if event.link is not None and len(links) < max_links:
+            links.append(event.link)
+        accounts.add(str(event.metadata.get("account", "unknown")))
+    account_label = ", ".join("@" + account for account in sorted(accounts))
     body = (
         f"Detected {len(sorted_events)} new tweets in the last run across {account_label}."
         f" Showing up to {max_links} links."
     )
-    return AlertPayload(
+    return AlertPayload.model_construct(
         alert_id=build_alert_id("tweets-grouped", str(len(sorted_events)), now),
         source="tweets",
         level="info",
@@ -167,16 +198,23 @@ def group_tweet_alert(events: list[ChangeEvent], now: datetime, max_links: int)
 
 
 def group_target_alert(target: str, events: list[ChangeEvent], now: datetime, max_links: int) -> AlertPayload:
-    lines = [f"- {event.summary}" for event in events[:max_links]]
-    links = [event.link for event in events if event.link is not None][:max_links]
+    lines: list[str] = []
+    links: list[str] = []
+    severity: AlertLevel = "info"
+    for event in events:
+        if len(lines) < max_links:
+            lines.append(f"- {event.summary}")
+        if event.link is not None and len(links) < max_links:
+            links.append(event.link)
+        if event.severity == "critical":
+            severity = "critical"
+        elif event.severity == "warning" and severity != "critical":
+            severity = "warning"
     extra = len(events) - len(lines)
     if extra > 0:
         lines.append(f"- +{extra} more")
     body = "\n".join(lines)
-    severity: AlertLevel = "warning" if any(event.severity == "warning" for event in events) else "info"
-    if any(event.severity == "critical" for event in events):
-        severity = "critical"
-    return AlertPayload(
+    return AlertPayload.model_construct(
         alert_id=build_alert_id(f"{target}-summary", body, now),
         source=target,
         level=severity,
@@ -199,62 +237,162 @@ def next_retry_time(settings: Settings, now: datetime, attempts: int, first_fail
     return now + timedelta(minutes=delay_minutes)
 
 
-def trim_sent_ids(ids: list[str], limit: int = 2000) -> list[str]:
-    if len(ids) <= limit:
-        return ids
-    return ids[-limit:]
+def mark_sent(sent_ids: dict[str, None], alert_id: str) -> None:
+    # Re-sending moves the id to the newest end, so trimming always drops the least recently sent.
+    sent_ids.pop(alert_id, None)
+    sent_ids[alert_id] = None
+
+
+def trim_sent_ids(sent_ids: dict[str, None], limit: int = 2000) -> None:
+    while len(sent_ids) > limit:
+        del sent_ids[next(iter(sent_ids))]
+
+
+def squash_alerts(alerts: list[AlertPayload], max_links: int) -> list[tuple[AlertPayload, list[AlertPayload]]]:
+    # Alerts with the same source, level, title and body are sent once, titled with how many were folded together.
+    # Each message carries the alerts it replaces, so all of their ids are marked sent or queued for retry.
+    groups: dict[tuple[str, str, str, str], list[AlertPayload]] = {}
+    for alert in alerts:
+        groups.setdefault((alert.source, alert.level, alert.title, alert.body), []).append(alert)
+    squashed: list[tuple[AlertPayload, list[AlertPayload]]] = []
+    for group in groups.values():
+        first = group[0]
+        if len(group) > 1:
+            links = list(dict.fromkeys(link for alert in group for link in alert.links))[:max_links]
+            tags = list(dict.fromkeys(tag for alert in group for tag in alert.tags))
+            first = first.model_copy(update={"title": f"[x{len(group)}] {first.title}", "links": links, "tags": tags})
+        squashed.append((first, group))
+    return squashed
+
+
+def settle_deliveries(
+    squashed: list[tuple[AlertPayload, list[AlertPayload]]],
+    results: list[bool],
+    sent_ids: dict[str, None],
+    remaining_pending: dict[str, PendingAlert],
+    settings: Settings,
+    now: datetime,
+) -> int:
+    sent_count = 0
+    for (_, folded), sent in zip(squashed, results, strict=True):
+        if sent:
+            for alert in folded:
+                mark_sent(sent_ids, alert.alert_id)
+            sent_count += 1
+            continue
+        next_time = next_retry_time(settings, now, 1, now)
+        if next_time is None:
+            continue
+        for alert in folded:
+            remaining_pending[alert.alert_id] = PendingAlert(
+                payload=alert,
+                attempts=1,
+                first_failed_at=now,
+                next_retry_at=next_time,
+            )
+    return sent_count
+
+
+def settle_pending_deliveries(
+    due_pending: list[PendingAlert],
+    squashed: list[tuple[AlertPayload, list[AlertPayload]]],
+    results: list[bool],
+    sent_ids: dict[str, None],
+    remaining_pending: dict[str, PendingAlert],
+    settings: Settings,
+    now: datetime,
+    log: structlog.stdlib.BoundLogger,
+) -> int:
+    # Retries are squashed like fresh alerts, so a failed "[xN]" message is retried as one post, not N.
+    pending_by_id = {pending_item.payload.alert_id: pending_item for pending_item in due_pending}
+    sent_count = 0
+    for (_, folded), sent in zip(squashed, results, strict=True):
+        if sent:
+            for alert in folded:
+                mark_sent(sent_ids, alert.alert_id)
+            sent_count += 1
+            continue
+        for alert in folded:
+            pending_item = pending_by_id[alert.alert_id]
+            attempts = pending_item.attempts + 1
+            next_time = next_retry_time(settings, now, attempts, pending_item.first_failed_at)
+            if next_time is None:
+                log.error("alert_dropped_after_retry_window", alert_id=alert.alert_id)
+                continue
+            remaining_pending[alert.alert_id] = PendingAlert(
+                payload=pending_item.payload,
+                attempts=attempts,
+                first_failed_at=pending_item.first_failed_at,
+                next_retry_at=next_time,
+            )
+    return sent_count
 
 
-def record_change(state: dict[str, Any], event: ChangeEvent) -> None:
-    digest = state.setdefault("digest", {})
-    changes = digest.setdefault("changes", [])
-    if isinstance(changes, list):
-        changes.append(
-            {
-                "occurred_at": event.occurred_at.isoformat(),
-                "target": event.target,
-                "summary": event.summary,
-                "severity": event.severity,
-                "kind": event.kind,
-            }
-        )
-        if len(changes) > 5000:
-            del changes[:-5000]
-
-
-def record_failed_check(state: dict[str, Any], target: str, error: str, now: datetime) -> None:
-    digest = state.setdefault("digest", {})
-    failed = digest.setdefault("failed_checks", [])
-    if isinstance(failed, list):
-        failed.append({"occurred_at": now.isoformat(), "target": target, "error": error})
-        if len(failed) > 1000:
-            del failed[:-1000]
+def record_change(changes: deque[dict[str, Any]], event: ChangeEvent) -> None:
+    changes.append(
+        {
+            "occurred_at": event.occurred_at.isoformat(),
+            "target": event.target,
+            "summary": event.summary,
+            "severity": event.severity,
+            "kind": event.kind,
+        }
+    )
+
+
+def record_failed_check(failed_checks: deque[dict[str, Any]], target: str, error: str, now: datetime) -> None:
+    failed_checks.append({"occurred_at": now.isoformat(), "target": target, "error": error})
+
+
+async def gather_checks(checks: dict[str, Coroutine[Any, Any, CheckResult]]) -> dict[str, CheckResult | Exception]:
+    results = await asyncio.gather(*checks.values(), return_exceptions=True)
+    outcomes: dict[str, CheckResult | Exception] = {}
+    for target_key, result in zip(checks, results, strict=True):
+        if isinstance(result, BaseException) and not isinstance(result, Exception):
+            raise result
+        outcomes[target_key] = result
+    return outcomes
 
 
-async def deliver_alert(
+async def send_to_slack(
     payload: AlertPayload,
     slack_client: SlackClient,
-    email_client: EmailClient | None,
     log: structlog.stdlib.BoundLogger,
 ) -> bool:
     try:
-        sent_to_slack = await slack_client.send(payload)
+        return await slack_client.send(payload)
     except Exception as exc:
         log.exception("slack_send_failed", alert_id=payload.alert_id, error=str(exc))
-        sent_to_slack = False
+        return False
 
-    if sent_to_slack:
-        return True
 
-    if email_client is None:
-        return False
+async def deliver_alerts(
+    payloads: list[AlertPayload],
+    slack_client: SlackClient,
+    email_client: EmailClient | None,
+    log: structlog.stdlib.BoundLogger,
+) -> list[bool]:
+    semaphore = asyncio.Semaphore(DELIVERY_CONCURRENCY)
+
+    async def send(payload: AlertPayload) -> bool:
+        async with semaphore:
+            return await send_to_slack(payload, slack_client, log)
 
+    results = list(await asyncio.gather(*(send(payload) for payload in payloads)))
+    failed = [index for index, sent in enumerate(results) if not sent]
+    if not failed or email_client is None:
+        return results
+
+    # Everything Slack rejected goes out over a single SMTP session.
+    fallback = [payloads[index] for index in failed]
     try:
-        sent_to_email = await email_client.send_alert(payload)
+        email_results = await email_client.send_many(fallback)
     except Exception as exc:
-        log.exception("email_send_failed", alert_id=payload.alert_id, error=str(exc))
-        return False
-    return sent_to_email
+        log.exception("email_send_failed", alert_ids=[payload.alert_id for payload in fallback], error=str(exc))
+        return results
+    for index, sent in zip(failed, email_results, strict=True):
+        results[index] = sent
+    return results
 
 
 async def run() -> int:
@@ -271,15 +409,17 @@ async def run() -> int:
 
     targets: dict[str, Any] = state.setdefault("targets", {})
     digest = state.setdefault("digest", {})
-    digest.setdefault("changes", [])
     digest.setdefault("alerts_sent", 0)
-    digest.setdefault("failed_checks", [])
     digest.setdefault("last_sent_date", None)
+    # load_state always provides both rings; bind them once for the record_* helpers.
+    changes: deque[dict[str, Any]] = digest["changes"]
+    failed_checks: deque[dict[str, Any]] = digest["failed_checks"]
     meta = state.setdefault("meta", {})
-    sent_alert_ids = meta.setdefault("sent_alert_ids", [])
-    if not isinstance(sent_alert_ids, list):
-        sent_alert_ids = []
-        meta["sent_alert_ids"] = sent_alert_ids
+    sent_ids_raw = meta.get("sent_alert_ids", [])
+    # Insertion-ordered, so it doubles as the O(1) membership set and the oldest-first ring.
+    sent_ids: dict[str, None] = (
+        dict.fromkeys(str(value) for value in sent_ids_raw) if isinstance(sent_ids_raw, list) else {}
+    )
 
     watchdog_events: list[AlertPayload] = []
     last_successful_run = parse_iso(meta.get("last_successful_run"))
@@ -315,12 +455,7 @@ async def run() -> int:
             )
             meta["watchdog_alerted"] = False
 
-    pending_models: list[PendingAlert] = []
-    for pending_raw_item in pending_raw:
-        try:
-            pending_models.append(PendingAlert.model_validate(pending_raw_item))
-        except Exception:
-            log.warning("invalid_pending_alert_dropped", pending=pending_raw_item)
+    pending_models = load_pending_models(pending_raw, log)
 
     new_alerts: list[AlertPayload] = []
     current_version = current_app_version()
@@ -343,254 +478,274 @@ async def run() -> int:
         targets[target_key] = value
         return value
 
-    async with AsyncFetcher(timeout_seconds=10.0, retries=3) as fetcher:
-        primary_monitor_states: dict[str, str] = {}
-        if settings.betterstack_enable_primary_gate:
-            try:
-                primary_monitor_states = await fetch_monitor_statuses(
-                    fetcher=fetcher,
-                    api_token=settings.betterstack_api_token or "",
-                )
-            except Exception as exc:
-                record_failed_check(state, "betterstack_primary", str(exc), now)
-                log.exception("betterstack_primary_fetch_failed", error=str(exc))
+    status_checks = {
+        "x_status": [settings.x_status_url, settings.x_incidents_url],
+        "twitterapi_status": [settings.twitterapi_status_url],
+    }
 
-        status_checks = {
-            "x_status": [settings.x_status_url, settings.x_incidents_url],
-            "twitterapi_status": [settings.twitterapi_status_url],
-        }
+    tweet_accounts = {
+        "api_tweets": settings.api_account_name,
+        "xdevelopers_tweets": settings.xdevelopers_account_name,
+    }
+    docs_targets = [
+        "x_docs_github",
+        "x_changelog",
+        "twitterapi_changelog",
+        "twitterapi_sitemap",
+    ]
+
+    def is_due(target_key: str, interval_minutes: int) -> bool:
+        last_checked = target_state(target_key).get("last_checked")
+        return should_run(last_checked if isinstance(last_checked, str) else None, interval_minutes, now)
+
+    # Decide what is due before opening the fetcher, so an idle run never builds an HTTP client.
+    due_status = [target_key for target_key in status_checks if is_due(target_key, settings.status_interval_minutes)]
+    due_tweets = [target_key for target_key in tweet_accounts if is_due(target_key, settings.tweets_interval_minutes)]
+    due_docs = [target_key for target_key in docs_targets if is_due(target_key, settings.docs_interval_minutes)]
+
+    primary_monitor_states: dict[str, str] = {}
+    outcomes: dict[str, CheckResult | Exception] = {}
+    if due_status or due_tweets or due_docs:
+        async with AsyncFetcher(timeout_seconds=10.0, retries=3) as fetcher:
+
+            async def primary_gate() -> dict[str, str]:
+                # Only status results read the primary states, so skip the request when none are due.
+                if not settings.betterstack_enable_primary_gate or not due_status:
+                    return {}
+                try:
+                    return await fetch_monitor_statuses(
+                        fetcher=fetcher,
+                        api_token=settings.betterstack_api_token or "",
+                    )
+                except Exception as exc:
+                    record_failed_check(failed_checks, "betterstack_primary", str(exc), now)
+                    log.exception("betterstack_primary_fetch_failed", error=str(exc))
+                    return {}
 
-        for target_key, urls in status_checks.items():
-            t_state = target_state(target_key)
-            last_checked = t_state.get("last_checked")
-            if not isinstance(last_checked, str):
-                last_checked = None
-            if not should_run(last_checked, settings.status_interval_minutes, now):
-                continue
-            try:
-                result = await check_status_page(
+            def docs_check(target_key: str, t_state: dict[str, Any]) -> Coroutine[Any, Any, CheckResult]:
+                if target_key == "x_docs_github":
+                    return check_github_docs(
+                        target=target_key,
+                        previous_state=t_state,
+                        fetcher=fetcher,
+                        repo=settings.github_docs_repo,
+                        github_token=settings.github_token,
+                        now=now,
+                    )
+                if target_key == "x_changelog":
+                    return check_changelog(
+                        target=target_key,
+                        url=settings.x_changelog_url,
+                        previous_state=t_state,
+                        fetcher=fetcher,
+                        now=now,
+                    )
+                if target_key == "twitterapi_changelog":
+                    return check_changelog(
+                        target=target_key,
+                        url=settings.twitterapi_changelog_url,
+                        previous_state=t_state,
+                        fetcher=fetcher,
+                        now=now,
+                    )
+                return check_sitemap(
                     target=target_key,
-                    urls=urls,
+                    sitemap_url=settings.twitterapi_sitemap_url,
                     previous_state=t_state,
                     fetcher=fetcher,
                     now=now,
+                    include_patterns=settings.sitemap_include_patterns,
+                    exclude_patterns=settings.sitemap_exclude_patterns,
+                )
+
+            # Every due check runs at once on the shared fetcher, alongside the primary gate;
+            # results are then applied group by group, in order.
+            due_checks: dict[str, Coroutine[Any, Any, CheckResult]] = {}
+            for target_key in due_status:
+                due_checks[target_key] = check_status_page(
+                    target=target_key,
+                    urls=status_checks[target_key],
+                    previous_state=target_state(target_key),
+                    fetcher=fetcher,
+                    now=now,
                     alert_delay_minutes=0,
                 )
-                previous_failures = int(t_state.get("consecutive_failures", 0))
-                if previous_failures >= settings.unreachable_alert_after_failures:
-                    new_alerts.append(
-                        AlertPayload(
-                            alert_id=build_alert_id(target_key, "reachable_again", now),
-                            source=target_key,
-                            level="resolved",
-                            title=f"🟢 {target_key} reachable again",
-                            body=f"{target_key} recovered after {previous_failures} failed checks.",
-                            links=urls[:1],
-                            created_at=now,
-                            tags=["recovery"],
-                        )
+            for target_key in due_tweets:
+                due_checks[target_key] = check_account_tweets(
+                    target=target_key,
+                    account=tweet_accounts[target_key],
+                    previous_state=target_state(target_key),
+                    fetcher=fetcher,
+                    api_key=settings.twitterapi_io_key,
+                    now=now,
+                )
+            for target_key in due_docs:
+                due_checks[target_key] = docs_check(target_key, target_state(target_key))
+            primary_monitor_states, outcomes = await asyncio.gather(primary_gate(), gather_checks(due_checks))
+
+    for target_key, urls in status_checks.items():
+        if target_key not in outcomes:
+            continue
+        t_state = target_state(target_key)
+        try:
+            result = outcomes[target_key]
+            if isinstance(result, Exception):
+                raise result
+            previous_failures = int(t_state.get("consecutive_failures", 0))
+            if previous_failures >= settings.unreachable_alert_after_failures:
+                new_alerts.append(
+                    AlertPayload(
+                        alert_id=build_alert_id(target_key, "reachable_again", now),
+                        source=target_key,
+                        level="resolved",
+                        title=f"🟢 {target_key} reachable again",
+                        body=f"{target_key} recovered after {previous_failures} failed checks.",
+                        links=urls[:1],
+                        created_at=now,
+                        tags=["recovery"],
                     )
-                t_state.update(result.state_update)
-                t_state["consecutive_failures"] = 0
-                t_state["last_error"] = None
-                for event in result.events:
-                    record_change(state, event)
-
-                monitor_id = primary_monitor_id_for_target(settings, target_key)
-                primary_state = (
-                    primary_monitor_states.get(monitor_id, "unknown") if monitor_id is not None else "unknown"
                 )
-                t_state["primary_state"] = primary_state
-
-                current_phase_raw = result.state_update.get("phase")
-                current_phase = current_phase_raw if isinstance(current_phase_raw, str) else "unknown"
-                backup_alert_active = bool(t_state.get("backup_alert_active", False))
-                silent_since_raw = t_state.get("primary_silent_since")
-                silent_since = parse_iso(silent_since_raw if isinstance(silent_since_raw, str) else None)
-
-                if is_backup_non_operational(current_phase):
-                    if is_primary_non_operational(primary_state):
-                        t_state["primary_silent_since"] = None
-                    else:
-                        if silent_since is None:
-                            t_state["primary_silent_since"] = now.isoformat()
-                            silent_since = now
-                        silence_elapsed = now - silent_since
-                        if (
-                            silence_elapsed >= timedelta(minutes=settings.status_backup_alert_delay_minutes)
-                            and not backup_alert_active
-                        ):
-                            phase_label = current_phase.replace("_", " ")
-                            new_alerts.append(
-                                AlertPayload(
-                                    alert_id=build_alert_id(target_key, f"primary_silent_{phase_label}", now),
-                                    source=target_key,
-                                    level=phase_to_level(current_phase),
-                                    title=f"⚠️ {target_key} backup incident",
-                                    body=(
-                                        f"Backup check detected {phase_label} while Better Stack stayed operational"
-                                        f" for at least {settings.status_backup_alert_delay_minutes} minutes."
-                                    ),
-                                    links=urls[:1],
-                                    created_at=now,
-                                    tags=["backup_signal", "primary_silent"],
-                                )
-                            )
-                            backup_alert_active = True
-                        if backup_alert_active:
-                            for event in result.events:
-                                if event.kind != "status_update":
-                                    continue
-                                update_alert = event_to_alert(event)
-                                update_alert.tags = update_alert.tags + ["backup_signal"]
-                                new_alerts.append(update_alert)
-                else:
+            t_state.update(result.state_update)
+            t_state["consecutive_failures"] = 0
+            t_state["last_error"] = None
+            for event in result.events:
+                record_change(changes, event)
+
+            monitor_id = primary_monitor_id_for_target(settings, target_key)
+            primary_state = primary_monitor_states.get(monitor_id, "unknown") if monitor_id is not None else "unknown"
+            t_state["primary_state"] = primary_state
+
+            current_phase_raw = result.state_update.get("phase")
+            current_phase = current_phase_raw if isinstance(current_phase_raw, str) else "unknown"
+            backup_alert_active = bool(t_state.get("backup_alert_active", False))
+            silent_since_raw = t_state.get("primary_silent_since")
+            silent_since = parse_iso(silent_since_raw if isinstance(silent_since_raw, str) else None)
+
+            if is_backup_non_operational(current_phase):
+                if is_primary_non_operational(primary_state):
                     t_state["primary_silent_since"] = None
-                    if backup_alert_active:
+                else:
+                    if silent_since is None:
+                        t_state["primary_silent_since"] = now.isoformat()
+                        silent_since = now
+                    silence_elapsed = now - silent_since
+                    if (
+                        silence_elapsed >= timedelta(minutes=settings.status_backup_alert_delay_minutes)
+                        and not backup_alert_active
+                    ):
+                        phase_label = PHASE_LABELS.get(current_phase) or current_phase.replace("_", " ")
                         new_alerts.append(
                             AlertPayload(
-                                alert_id=build_alert_id(target_key, "backup_incident_resolved", now),
+                                alert_id=build_alert_id(target_key, f"primary_silent_{phase_label}", now),
                                 source=target_key,
-                                level="resolved",
-                                title=f"🟢 {target_key} backup incident resolved",
-                                body="Backup-detected incident has recovered.",
+                                level=phase_to_level(current_phase),
+                                title=f"⚠️ {target_key} backup incident",
+                                body=(
+                                    f"Backup check detected {phase_label} while Better Stack stayed operational"
+                                    f" for at least {settings.status_backup_alert_delay_minutes} minutes."
+                                ),
                                 links=urls[:1],
                                 created_at=now,
-                                tags=["backup_signal", "resolved"],
+                                tags=["backup_signal", "primary_silent"],
                             )
                         )
-                        backup_alert_active = False
-                t_state["backup_alert_active"] = backup_alert_active
-            except Exception as exc:
-                failures = int(t_state.get("consecutive_failures", 0)) + 1
-                t_state["consecutive_failures"] = failures
-                t_state["last_error"] = str(exc)
-                t_state["last_checked"] = now.isoformat()
-                record_failed_check(state, target_key, str(exc), now)
-                if failures >= settings.unreachable_alert_after_failures and not bool(
-                    t_state.get("unreachable_alerted", False)
-                ):
+                        backup_alert_active = True
+                    if backup_alert_active:
+                        for event in result.events:
+                            if event.kind != "status_update":
+                                continue
+                            update_alert = event_to_alert(event)
+                            update_alert.tags = update_alert.tags + ["backup_signal"]
+                            new_alerts.append(update_alert)
+            else:
+                t_state["primary_silent_since"] = None
+                if backup_alert_active:
                     new_alerts.append(
                         AlertPayload(
-                            alert_id=build_alert_id(target_key, "unreachable", now),
+                            alert_id=build_alert_id(target_key, "backup_incident_resolved", now),
                             source=target_key,
-                            level="warning",
-                            title=f"⚠️ {target_key} unreachable",
-                            body=(
-                                f"{target_key} has been unreachable for {failures} consecutive checks."
-                                f" Last error: {str(exc)}"
-                            ),
+                            level="resolved",
+                            title=f"🟢 {target_key} backup incident resolved",
+                            body="Backup-detected incident has recovered.",
                             links=urls[:1],
                             created_at=now,
-                            tags=["unreachable"],
+                            tags=["backup_signal", "resolved"],
                         )
                     )
-                    t_state["unreachable_alerted"] = True
-                continue
-            t_state["unreachable_alerted"] = False
-
-        tweet_events: list[ChangeEvent] = []
-        tweet_accounts = {
-            "api_tweets": settings.api_account_name,
-            "xdevelopers_tweets": settings.xdevelopers_account_name,
-        }
-        for target_key, account in tweet_accounts.items():
-            t_state = target_state(target_key)
-            last_checked = t_state.get("last_checked")
-            if not isinstance(last_checked, str):
-                last_checked = None
-            if not should_run(last_checked, settings.tweets_interval_minutes, now):
-                continue
-            try:
-                result = await check_account_tweets(
-                    target=target_key,
-                    account=account,
-                    previous_state=t_state,
-                    fetcher=fetcher,
-                    api_key=settings.twitterapi_io_key,
-                    now=now,
+                    backup_alert_active = False
+            t_state["backup_alert_active"] = backup_alert_active
+        except Exception as exc:
+            failures = int(t_state.get("consecutive_failures", 0)) + 1
+            t_state["consecutive_failures"] = failures
+            t_state["last_error"] = str(exc)
+            t_state["last_checked"] = now.isoformat()
+            record_failed_check(failed_checks, target_key, str(exc), now)
+            if failures >= settings.unreachable_alert_after_failures and not bool(
+                t_state.get("unreachable_alerted", False)
+            ):
+                new_alerts.append(
+                    AlertPayload(
+                        alert_id=build_alert_id(target_key, "unreachable", now),
+                        source=target_key,
+                        level="warning",
+                        title=f"⚠️ {target_key} unreachable",
+                        body=(
+                            f"{target_key} has been unreachable for {failures} consecutive checks."
+                            f" Last error: {str(exc)}"
+                        ),
+                        links=urls[:1],
+                        created_at=now,
+                        tags=["unreachable"],
+                    )
                 )
-                t_state.update(result.state_update)
-                t_state["consecutive_failures"] = 0
-                t_state["last_error"] = None
-                for event in result.events:
-                    record_change(state, event)
-                    tweet_events.append(event)
-            except Exception as exc:
-                failures = int(t_state.get("consecutive_failures", 0)) + 1
-                t_state["consecutive_failures"] = failures
-                t_state["last_error"] = str(exc)
-                t_state["last_checked"] = now.isoformat()
-                record_failed_check(state, target_key, str(exc), now)
-
-        if tweet_events:
-            grouped = group_tweet_alert(tweet_events, now, settings.max_links_per_alert)
-            if grouped is not None:
-                new_alerts.append(grouped)
-
-        docs_targets = [
-            "x_docs_github",
-            "x_changelog",
-            "twitterapi_changelog",
-            "twitterapi_sitemap",
-        ]
+                t_state["unreachable_alerted"] = True
+            continue
+        t_state["unreachable_alerted"] = False
 
-        for target_key in docs_targets:
-            t_state = target_state(target_key)
-            last_checked = t_state.get("last_checked")
-            if not isinstance(last_checked, str):
-                last_checked = None
-            if not should_run(last_checked, settings.docs_interval_minutes, now):
-                continue
-            try:
-                if target_key == "x_docs_github":
-                    result = await check_github_docs(
-                        target=target_key,
-                        previous_state=t_state,
-                        fetcher=fetcher,
-                        repo=settings.github_docs_repo,
-                        github_token=settings.github_token,
-                        now=now,
-                    )
-                elif target_key == "x_changelog":
-                    result = await check_changelog(
-                        target=target_key,
-                        url=settings.x_changelog_url,
-                        previous_state=t_state,
-                        fetcher=fetcher,
-                        now=now,
-                    )
-                elif target_key == "twitterapi_changelog":
-                    result = await check_changelog(
-                        target=target_key,
-                        url=settings.twitterapi_changelog_url,
-                        previous_state=t_state,
-                        fetcher=fetcher,
-                        now=now,
-                    )
-                else:
-                    result = await check_sitemap(
-                        target=target_key,
-                        sitemap_url=settings.twitterapi_sitemap_url,
-                        previous_state=t_state,
-                        fetcher=fetcher,
-                        now=now,
-                        include_patterns=settings.sitemap_include_patterns,
-                        exclude_patterns=settings.sitemap_exclude_patterns,
-                    )
-                t_state.update(result.state_update)
-                t_state["consecutive_failures"] = 0
-                t_state["last_error"] = None
-                if result.events:
-                    for event in result.events:
-                        record_change(state, event)
-                    new_alerts.append(group_target_alert(target_key, result.events, now, settings.max_links_per_alert))
-            except Exception as exc:
-                failures = int(t_state.get("consecutive_failures", 0)) + 1
-                t_state["consecutive_failures"] = failures
-                t_state["last_error"] = str(exc)
-                t_state["last_checked"] = now.isoformat()
-                record_failed_check(state, target_key, str(exc), now)
+    tweet_events: list[ChangeEvent] = []
+    for target_key in tweet_accounts:
+        if target_key not in outcomes:
+            continue
+        t_state = target_state(target_key)
+        outcome = outcomes[target_key]
+        if isinstance(outcome, Exception):
+            failures = int(t_state.get("consecutive_failures", 0)) + 1
+            t_state["consecutive_failures"] = failures
+            t_state["last_error"] = str(outcome)
+            t_state["last_checked"] = now.isoformat()
+            record_failed_check(failed_checks, target_key, str(outcome), now)
+            continue
+        t_state.update(outcome.state_update)
+        t_state["consecutive_failures"] = 0
+        t_state["last_error"] = None
+        for event in outcome.events:
+            record_change(changes, event)
+            tweet_events.append(event)
+
+    if tweet_events:
+        grouped = group_tweet_alert(tweet_events, now, settings.max_links_per_alert)
+        if grouped is not None:
+            new_alerts.append(grouped)
+
+    for target_key in docs_targets:
+        if target_key not in outcomes:
+            continue
+        t_state = target_state(target_key)
+        outcome = outcomes[target_key]
+        if isinstance(outcome, Exception):
+            failures = int(t_state.get("consecutive_failures", 0)) + 1
+            t_state["consecutive_failures"] = failures
+            t_state["last_error"] = str(outcome)
+            t_state["last_checked"] = now.isoformat()
+            record_failed_check(failed_checks, target_key, str(outcome), now)
+            continue
+        t_state.update(outcome.state_update)
+        t_state["consecutive_failures"] = 0
+        t_state["last_error"] = None
+        if outcome.events:
+            for event in outcome.events:
+                record_change(changes, event)
+            new_alerts.append(group_target_alert(target_key, outcome.events, now, settings.max_links_per_alert))
 
     local_now = now.astimezone(ZoneInfo(settings.tz_name))
     last_digest_date = digest.get("last_sent_date")
@@ -616,7 +771,6 @@ async def run() -> int:
 
     all_alerts = watchdog_events + new_alerts
 
-    slack_client = SlackClient(settings.slack_webhook_url)
     email_client = (
         EmailClient(settings.gmail_address or "", settings.gmail_app_password or "", settings.email_recipients)
         if settings.allow_email_fallback
@@ -625,54 +779,46 @@ async def run() -> int:
 
     remaining_pending: dict[str, PendingAlert] = {}
 
+    due_pending: list[PendingAlert] = []
     for pending_item in pending_models:
         if pending_item.next_retry_at > now:
             remaining_pending[pending_item.payload.alert_id] = pending_item
             continue
-        sent = await deliver_alert(pending_item.payload, slack_client, email_client, log)
-        if sent:
-            sent_alert_ids.append(pending_item.payload.alert_id)
-            digest["alerts_sent"] = int(digest.get("alerts_sent", 0)) + 1
-            continue
-        attempts = pending_item.attempts + 1
-        next_time = next_retry_time(settings, now, attempts, pending_item.first_failed_at)
-        if next_time is None:
-            log.error("alert_dropped_after_retry_window", alert_id=pending_item.payload.alert_id)
-            continue
-        remaining_pending[pending_item.payload.alert_id] = PendingAlert(
-            payload=pending_item.payload,
-            attempts=attempts,
-            first_failed_at=pending_item.first_failed_at,
-            next_retry_at=next_time,
-        )
-
-    sent_id_set = {str(value) for value in sent_alert_ids}
-    for alert in all_alerts:
-        if alert.alert_id in sent_id_set:
-            continue
-        if alert.alert_id in remaining_pending:
-            continue
-        sent = await deliver_alert(alert, slack_client, email_client, log)
-        if sent:
-            sent_alert_ids.append(alert.alert_id)
-            sent_id_set.add(alert.alert_id)
-            digest["alerts_sent"] = int(digest.get("alerts_sent", 0)) + 1
-            continue
-        next_time = next_retry_time(settings, now, 1, now)
-        if next_time is None:
-            continue
-        remaining_pending[alert.alert_id] = PendingAlert(
-            payload=alert,
-            attempts=1,
-            first_failed_at=now,
-            next_retry_at=next_time,
-        )
-
-    meta["sent_alert_ids"] = trim_sent_ids([str(value) for value in sent_alert_ids])
+        due_pending.append(pending_item)
+
+    # Idle runs never open a Slack connection.
+    if due_pending or all_alerts:
+        async with SlackClient(settings.slack_webhook_url) as slack_client:
+            squashed_pending = squash_alerts(
+                [pending_item.payload for pending_item in due_pending], settings.max_links_per_alert
+            )
+            pending_results = await deliver_alerts(
+                [alert for alert, _ in squashed_pending], slack_client, email_client, log
+            )
+            pending_sent = settle_pending_deliveries(
+                due_pending, squashed_pending, pending_results, sent_ids, remaining_pending, settings, now, log
+            )
+            digest["alerts_sent"] = int(digest.get("alerts_sent", 0)) + pending_sent
+
+            to_deliver: list[AlertPayload] = []
+            queued_ids: set[str] = set()
+            for alert in all_alerts:
+                if alert.alert_id in sent_ids or alert.alert_id in remaining_pending or alert.alert_id in queued_ids:
+                    continue
+                queued_ids.add(alert.alert_id)
+                to_deliver.append(alert)
+            squashed = squash_alerts(to_deliver, settings.max_links_per_alert)
+
+            alert_results = await deliver_alerts([alert for alert, _ in squashed], slack_client, email_client, log)
+            sent_count = settle_deliveries(squashed, alert_results, sent_ids, remaining_pending, settings, now)
+            digest["alerts_sent"] = int(digest.get("alerts_sent", 0)) + sent_count
+
+    trim_sent_ids(sent_ids)
+    meta["sent_alert_ids"] = list(sent_ids)
     meta["last_successful_run"] = now.isoformat()
 
-    state_store.save_state(state)
-    state_store.save_pending([item.model_dump(mode="json") for item in remaining_pending.values()])
+    state_store.save_state(state, now)
+    state_store.save_pending(PENDING_ALERTS.dump_python(list(remaining_pending.values()), mode="json"))
 
     return 0
 
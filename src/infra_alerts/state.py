@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import json
-import tempfile
+from collections import deque
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from pydantic_core import from_json
 
-def now_iso() -> str:
-    return datetime.now(UTC).isoformat()
+STATE_ENCODER = json.JSONEncoder(ensure_ascii=True, indent=2, sort_keys=True)
+
+
+def now_iso(now: datetime | None = None) -> str:
+    return (now or datetime.now(UTC)).isoformat()
 
 
 def default_state() -> dict[str, Any]:
@@ -31,24 +35,44 @@ def default_state() -> dict[str, Any]:
     }
 
 
+# Digest history is kept as bounded rings in memory; appends evict the oldest entry instead of re-slicing a list.
+DIGEST_RING_LIMITS = {"changes": 5000, "failed_checks": 1000}
+
+
+def _as_digest_rings(digest: dict[str, Any]) -> None:
+    for key, limit in DIGEST_RING_LIMITS.items():
+        items = digest.get(key)
+        digest[key] = deque(items if isinstance(items, list) else [], maxlen=limit)
+
+
 class StateStore:
     def __init__(self, state_path: str, pending_path: str) -> None:
         self.state_file = Path(state_path)
         self.pending_file = Path(pending_path)
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
         self.pending_file.parent.mkdir(parents=True, exist_ok=True)
+        # Last bytes read from or written to each file, so an unchanged payload is not rewritten.
+        self._on_disk: dict[Path, bytes] = {}
 
     def load_state(self) -> dict[str, Any]:
+        state = self._read_state()
+        _as_digest_rings(state["digest"])
+        return state
+
+    def _read_state(self) -> dict[str, Any]:
         if not self.state_file.exists():
             return default_state()
-        raw = self.state_file.read_text(encoding="utf-8").strip()
+        raw = self._read_bytes(self.state_file).strip()
         if not raw:
             return default_state()
-        parsed = json.loads(raw)
+        parsed = from_json(raw)
         if not isinstance(parsed, dict):
             return default_state()
-        state = default_state()
-        state.update(parsed)
+        # Fill in only what is missing; a healthy file never needs the default structure.
+        state: dict[str, Any] = parsed
+        state.setdefault("version", 1)
+        if "last_updated" not in state:
+            state["last_updated"] = now_iso()
         if not isinstance(state.get("targets"), dict):
             state["targets"] = {}
         if not isinstance(state.get("digest"), dict):
@@ -57,27 +81,39 @@ class StateStore:
             state["meta"] = default_state()["meta"]
         return state
 
-    def save_state(self, state: dict[str, Any]) -> None:
-        state["last_updated"] = now_iso()
-        self._atomic_dump(self.state_file, state)
+    def save_state(self, state: dict[str, Any], now: datetime | None = None) -> None:
+        state["last_updated"] = now_iso(now)
+        digest = state.get("digest")
+        payload = state
+        if isinstance(digest, dict):
+            lists = {key: list(value) for key, value in digest.items() if isinstance(value, deque)}
+            payload = {**state, "digest": {**digest, **lists}}
+        self._atomic_dump(self.state_file, payload)
 
-    def load_pending(self) -> list[dict[str, Any]]:
+    def load_pending(self) -> list[Any]:
         if not self.pending_file.exists():
             return []
-        raw = self.pending_file.read_text(encoding="utf-8").strip()
+        raw = self._read_bytes(self.pending_file).strip()
         if not raw:
             return []
-        parsed = json.loads(raw)
-        if not isinstance(parsed, list):
-            return []
-        return [item for item in parsed if isinstance(item, dict)]
+        parsed = from_json(raw)
+        # Entries are checked by the PendingAlert validation in run(), which drops and logs bad ones.
+        return parsed if isinstance(parsed, list) else []
 
     def save_pending(self, pending: list[dict[str, Any]]) -> None:
         self._atomic_dump(self.pending_file, pending)
 
+    def _read_bytes(self, path: Path) -> bytes:
+        data = path.read_bytes()
+        self._on_disk[path] = data
+        return data
+
     def _atomic_dump(self, path: Path, payload: dict[str, Any] | list[dict[str, Any]]) -> None:
-        with tempfile.NamedTemporaryFile("w", delete=False, dir=path.parent, encoding="utf-8") as handle:
-            json.dump(payload, handle, ensure_ascii=True, indent=2, sort_keys=True)
-            handle.write("\n")
-            tmp_path = Path(handle.name)
+        data = (STATE_ENCODER.encode(payload) + "\n").encode("ascii")
+        if self._on_disk.get(path) == data and path.exists():
+            return
+        # Runs are serialised by the workflow, so a fixed sibling name is enough for an atomic replace.
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(data)
         tmp_path.replace(path)
+        self._on_disk[path] = data
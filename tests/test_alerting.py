@@ -1,35 +1,83 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import smtplib
+from datetime import UTC, datetime, timedelta
+from email.message import EmailMessage
 
+import httpx
 import pytest
 
-from infra_alerts.models import AlertPayload
-from infra_alerts.run_monitor import deliver_alert, next_retry_time
+from infra_alerts.alerting.email import EmailClient
+from infra_alerts.alerting.slack import SlackClient
+from infra_alerts.models import AlertPayload, PendingAlert
+from infra_alerts.run_monitor import (
+    deliver_alerts,
+    load_pending_models,
+    mark_sent,
+    next_retry_time,
+    settle_deliveries,
+    settle_pending_deliveries,
+    squash_alerts,
+    trim_sent_ids,
+)
 
 
 class FakeSlack:
     def __init__(self, succeed: bool) -> None:
         self.succeed = succeed
+        self.titles: list[str] = []
 
     async def send(self, payload: AlertPayload) -> bool:
+        self.titles.append(payload.title)
         return self.succeed
 
 
 class FakeEmail:
     def __init__(self) -> None:
-        self.calls = 0
+        self.batches: list[list[str]] = []
 
-    async def send_alert(self, payload: AlertPayload) -> bool:
-        self.calls += 1
-        return True
+    async def send_many(self, payloads: list[AlertPayload]) -> list[bool]:
+        self.batches.append([payload.alert_id for payload in payloads])
+        return [True for _ in payloads]
+
+
+class FakeSMTP:
+    logins = 0
+    sent: list[str] = []
+
+    def __init__(self, host: str, port: int, timeout: float) -> None:
+        _ = (host, port, timeout)
+
+    def __enter__(self) -> FakeSMTP:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        _ = args
+
+    def login(self, user: str, password: str) -> None:
+        _ = (user, password)
+        FakeSMTP.logins += 1
+
+    def send_message(self, message: EmailMessage) -> None:
+        if "boom" in str(message["Subject"]):
+            raise smtplib.SMTPRecipientsRefused({})
+        if "reset" in str(message["Subject"]):
+            raise ConnectionResetError("connection reset")
+        FakeSMTP.sent.append(str(message["Subject"]))
 
 
 class FakeLog:
+    def __init__(self) -> None:
+        self.warnings: list[str] = []
+
     def exception(self, event: str, **kwargs: object) -> None:
         _ = event
         _ = kwargs
 
+    def warning(self, event: str, **kwargs: object) -> None:
+        _ = kwargs
+        self.warnings.append(event)
+
 
 class FakeSettings:
     retry_max_hours = 48
@@ -37,24 +85,51 @@ class FakeSettings:
     retry_tail_minutes = 360
 
 
-@pytest.mark.asyncio
-async def test_slack_failure_triggers_email() -> None:
-    alert = AlertPayload(
-        alert_id="a1",
+def make_alert(alert_id: str, title: str = "warning") -> AlertPayload:
+    return AlertPayload(
+        alert_id=alert_id,
         source="test",
         level="warning",
-        title="warning",
+        title=title,
         body="body",
         links=[],
         created_at=datetime.now(UTC),
         tags=[],
     )
+
+
+@pytest.mark.asyncio
+async def test_slack_failure_triggers_email() -> None:
+    alert = make_alert("a1")
     slack = FakeSlack(succeed=False)
     email = FakeEmail()
 
-    sent = await deliver_alert(alert, slack, email, FakeLog())
-    assert sent is True
-    assert email.calls == 1
+    results = await deliver_alerts([alert], slack, email, FakeLog())
+    assert results == [True]
+    assert email.batches == [["a1"]]
+
+
+async def test_slack_client_opens_http_client_only_when_entered() -> None:
+    slack = SlackClient("https://hooks.slack.test/services/x")
+    with pytest.raises(RuntimeError):
+        await slack.send(make_alert("a"))
+    async with slack:
+        assert slack._client is not None
+    assert slack._client is None
+
+
+async def test_slack_client_retries_rate_limited_post() -> None:
+    statuses = [429, 429, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses.pop(0), headers={"Retry-After": "1"})
+
+    async with SlackClient("https://hooks.slack.test/services/x", max_backoff_seconds=0.0) as slack:
+        assert slack._client is not None
+        await slack._client.aclose()
+        slack._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        assert await slack.send(make_alert("a"))
+    assert statuses == []
 
 
 def test_retry_schedule() -> None:
@@ -62,3 +137,105 @@ def test_retry_schedule() -> None:
     next_at = next_retry_time(FakeSettings(), now, 1, now)
     assert next_at is not None
     assert int((next_at - now).total_seconds()) == 60
+
+
+def test_squash_alerts_folds_identical_bodies() -> None:
+    alerts = [make_alert("a"), make_alert("b"), make_alert("c"), make_alert("d", title="other")]
+    alerts[0].links = ["https://example.com/a"]
+    alerts[1].links = ["https://example.com/b", "https://example.com/a"]
+    alerts[2] = alerts[2].model_copy(update={"body": "different"})
+    squashed = squash_alerts(alerts, max_links=5)
+    assert [alert.alert_id for alert, _ in squashed] == ["a", "c", "d"]
+    assert squashed[0][0].title.startswith("[x2] ")
+    assert squashed[0][0].links == ["https://example.com/a", "https://example.com/b"]
+    assert [alert.alert_id for alert in squashed[0][1]] == ["a", "b"]
+    assert squashed[1][0].title == alerts[2].title
+    assert squashed[2][0].title == "other"
+
+
+def test_failed_squashed_alert_queues_every_folded_id() -> None:
+    now = datetime.now(UTC)
+    squashed = squash_alerts([make_alert("a"), make_alert("b"), make_alert("c", title="other")], max_links=5)
+    sent_ids: dict[str, None] = {}
+    remaining: dict[str, PendingAlert] = {}
+
+    sent_count = settle_deliveries(squashed, [False, True], sent_ids, remaining, FakeSettings(), now)
+    assert sent_count == 1
+    assert list(sent_ids) == ["c"]
+    assert sorted(remaining) == ["a", "b"]
+    assert remaining["b"].payload.title == "warning"
+    assert all(item.attempts == 1 for item in remaining.values())
+
+
+async def test_failed_squashed_retry_is_posted_once() -> None:
+    now = datetime.now(UTC)
+    first_failed_at = now - timedelta(minutes=1)
+    due_pending = [
+        PendingAlert(payload=make_alert(alert_id), attempts=1, first_failed_at=first_failed_at, next_retry_at=now)
+        for alert_id in ("a", "b", "c")
+    ]
+    slack = FakeSlack(succeed=False)
+    sent_ids: dict[str, None] = {}
+    remaining: dict[str, PendingAlert] = {}
+
+    squashed = squash_alerts([pending_item.payload for pending_item in due_pending], max_links=5)
+    results = await deliver_alerts([alert for alert, _ in squashed], slack, None, FakeLog())
+    sent_count = settle_pending_deliveries(
+        due_pending, squashed, results, sent_ids, remaining, FakeSettings(), now, FakeLog()
+    )
+    assert slack.titles == ["[x3] warning"]
+    assert sent_count == 0
+    assert sorted(remaining) == ["a", "b", "c"]
+    assert all(item.attempts == 2 and item.first_failed_at == first_failed_at for item in remaining.values())
+
+
+def test_invalid_pending_entry_dropped_alone() -> None:
+    now = datetime.now(UTC)
+    valid = PendingAlert(payload=make_alert("a"), attempts=1, first_failed_at=now, next_retry_at=now)
+    log = FakeLog()
+    raw = [valid.model_dump(mode="json"), {"payload": {}}, "junk"]
+    assert load_pending_models(raw[:1], log) == [valid]
+    assert load_pending_models(raw, log) == [valid]
+    assert log.warnings == ["invalid_pending_alert_dropped"] * 2
+
+
+def test_sent_ids_keep_most_recent() -> None:
+    sent_ids = dict.fromkeys(["a", "b", "c"])
+    mark_sent(sent_ids, "a")
+    mark_sent(sent_ids, "d")
+    trim_sent_ids(sent_ids, limit=3)
+    assert list(sent_ids) == ["c", "a", "d"]
+
+
+@pytest.mark.asyncio
+async def test_slack_failures_share_one_email_batch() -> None:
+    email = FakeEmail()
+
+    results = await deliver_alerts([make_alert("a1"), make_alert("a2")], FakeSlack(succeed=False), email, FakeLog())
+    assert results == [True, True]
+    assert email.batches == [["a1", "a2"]]
+
+
+@pytest.mark.asyncio
+async def test_email_send_many_uses_one_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(smtplib, "SMTP_SSL", FakeSMTP)
+    monkeypatch.setattr(FakeSMTP, "logins", 0)
+    monkeypatch.setattr(FakeSMTP, "sent", [])
+    client = EmailClient("sender@example.com", "secret", ["a@example.com", "b@example.com"])
+
+    results = await client.send_many([make_alert("a1", "first"), make_alert("a2", "boom"), make_alert("a3", "third")])
+    assert results == [True, False, True]
+    assert FakeSMTP.logins == 1
+    assert len(FakeSMTP.sent) == 2
+
+
+@pytest.mark.asyncio
+async def test_email_send_many_keeps_sent_results_after_socket_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(smtplib, "SMTP_SSL", FakeSMTP)
+    monkeypatch.setattr(FakeSMTP, "logins", 0)
+    monkeypatch.setattr(FakeSMTP, "sent", [])
+    client = EmailClient("sender@example.com", "secret", ["a@example.com"])
+
+    results = await client.send_many([make_alert("a1", "first"), make_alert("a2", "reset"), make_alert("a3", "third")])
+    assert results == [True, False, True]
+    assert FakeSMTP.sent == ["[Verefy Infra Alert] warning: first", "[Verefy Infra Alert] warning: third"]
@@ -43,3 +43,35 @@ async def test_fetch_monitor_statuses() -> None:
     states = await fetch_monitor_statuses(fetcher=fetcher, api_token="token")
     assert states["111"] == "up"
     assert states["222"] == "down"
+
+
+class PagingFetcher:
+    def __init__(self, pages: dict[str, Any]) -> None:
+        self.pages = pages
+        self.calls: list[str] = []
+
+    async def get_json(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        params: dict[str, str] | None = None,
+    ) -> Any:
+        _ = headers
+        _ = params
+        self.calls.append(url)
+        return self.pages[url]
+
+
+@pytest.mark.asyncio
+async def test_fetch_monitor_statuses_stops_on_repeated_next_link() -> None:
+    endpoint = "https://uptime.betterstack.com/api/v2/monitors"
+    page_two = f"{endpoint}?page=2"
+    fetcher = PagingFetcher(
+        {
+            endpoint: {"data": [{"id": "111", "attributes": {"status": "up"}}], "pagination": {"next": page_two}},
+            page_two: {"data": [{"id": "222", "attributes": {"status": "down"}}], "pagination": {"next": page_two}},
+        }
+    )
+    states = await fetch_monitor_statuses(fetcher=fetcher, api_token="token")
+    assert states == {"111": "up", "222": "down"}
+    assert fetcher.calls == [endpoint, page_two]
@@ -43,3 +43,24 @@ def test_digest_counts_changes() -> None:
     payload = build_daily_digest(state, now)
     assert "total changes: 3" in payload.body
     assert "x_status: 2" in payload.body
+
+
+def test_digest_ignores_changes_outside_window() -> None:
+    now = datetime(2026, 2, 7, 12, 0, tzinfo=UTC)
+    state = {
+        "digest": {
+            "changes": [
+                {"occurred_at": "2026-02-06T11:59:59.999999+00:00", "target": "x_status"},
+                {"occurred_at": "2026-02-06T12:00:00+00:00", "target": "x_status"},
+                {"occurred_at": "2026-02-06T13:30:00+01:00", "target": "x_changelog"},
+                {"occurred_at": "2026-02-06T12:30:00+01:00", "target": "x_changelog"},
+            ],
+            "alerts_sent": 0,
+            "failed_checks": [],
+            "last_sent_date": None,
+        }
+    }
+    payload = build_daily_digest(state, now)
+    assert "total changes: 2" in payload.body
+    assert "x_changelog: 1" in payload.body
+    assert "x_status: 1" in payload.body
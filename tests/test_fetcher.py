@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import httpx
+
+from infra_alerts.fetcher import backoff_seconds, retry_after_seconds
+
+
+def test_retry_after_seconds_parses_delta_and_ignores_garbage() -> None:
+    assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": "7"})) == 7.0
+    assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": "soon"})) is None
+    assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": b"\xb2"})) is None
+    assert retry_after_seconds(httpx.Response(503)) is None
+    assert retry_after_seconds(httpx.Response(503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0.0
+
+
+def test_backoff_seconds_is_capped_and_respects_retry_after() -> None:
+    for attempt in range(10):
+        assert 0.0 <= backoff_seconds(attempt, max_backoff_seconds=30.0) <= 30.0
+    assert backoff_seconds(0, max_backoff_seconds=30.0, retry_after=12.0) >= 12.0
+    assert backoff_seconds(0, max_backoff_seconds=30.0, retry_after=600.0) == 30.0
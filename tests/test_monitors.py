@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from datetime import UTC, datetime
 from typing import Any
 
+import httpx
 import pytest
 
+from infra_alerts.monitors import status, tweets
+from infra_alerts.monitors.changelog import check_changelog
 from infra_alerts.monitors.github_docs import check_github_docs
 from infra_alerts.monitors.sitemap import check_sitemap
 from infra_alerts.monitors.status import check_status_page
@@ -12,8 +17,9 @@ from infra_alerts.monitors.tweets import check_account_tweets
 
 
 class FakeFetcher:
-    def __init__(self, payloads: dict[str, Any]) -> None:
+    def __init__(self, payloads: dict[str, Any], etag: str | None = None) -> None:
         self.payloads = payloads
+        self.etag = etag
 
     async def get_text(
         self,
@@ -26,6 +32,14 @@ class FakeFetcher:
             raise RuntimeError("missing text payload")
         return value
 
+    async def get_bytes(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        params: dict[str, str] | None = None,
+    ) -> bytes:
+        return json.dumps(await self.get_json(url, headers=headers, params=params)).encode("utf-8")
+
     async def get_json(
         self,
         url: str,
@@ -40,6 +54,17 @@ class FakeFetcher:
             raise RuntimeError("missing json payload")
         return value
 
+    async def get_json_with_response(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        params: dict[str, str] | None = None,
+    ) -> tuple[Any, httpx.Response]:
+        if self.etag is not None and headers is not None and headers.get("If-None-Match") == self.etag:
+            return None, httpx.Response(304)
+        response_headers = {"etag": self.etag} if self.etag is not None else {}
+        return await self.get_json(url, headers=headers, params=params), httpx.Response(200, headers=response_headers)
+
 
 @pytest.mark.asyncio
 async def test_status_change_detection() -> None:
@@ -63,6 +88,64 @@ async def test_status_change_detection() -> None:
     assert result.events[0].severity == "critical"
 
 
+@pytest.mark.asyncio
+async def test_status_ignores_legacy_content_hash_during_incident() -> None:
+    fetcher = FakeFetcher({"https://example.com/status": "<html><body>Major Outage currently active</body></html>"})
+    now = datetime.now(UTC)
+    previous_state = {
+        "phase": "major_outage",
+        "content_hash": "sha256:" + "0" * 64,
+        "incident_alerted": True,
+        "pending_incident_since": now.isoformat(),
+    }
+
+    result = await check_status_page(
+        target="x_status",
+        urls=["https://example.com/status"],
+        previous_state=previous_state,
+        fetcher=fetcher,
+        now=now,
+        alert_delay_minutes=0,
+    )
+    assert result.events == []
+    assert result.state_update["content_hash"].startswith("blake2b:")
+
+
+@pytest.mark.asyncio
+async def test_status_skips_parsing_unchanged_pages(monkeypatch: pytest.MonkeyPatch) -> None:
+    fetcher = FakeFetcher({"https://example.com/status": "<html><body>Partial Outage on the API</body></html>"})
+    now = datetime.now(UTC)
+    first = await check_status_page(
+        target="x_status",
+        urls=["https://example.com/status"],
+        previous_state={},
+        fetcher=fetcher,
+        now=now,
+        alert_delay_minutes=30,
+    )
+
+    def fail_extract(html: str) -> str:
+        raise AssertionError("unchanged page was parsed again")
+
+    monkeypatch.setattr(status, "_extract_text", fail_extract)
+    second = await check_status_page(
+        target="x_status",
+        urls=["https://example.com/status"],
+        previous_state=first.state_update,
+        fetcher=fetcher,
+        now=now,
+        alert_delay_minutes=30,
+    )
+    assert second.state_update["phase"] == "partial_outage"
+    assert second.state_update["content_hash"] == first.state_update["content_hash"]
+
+
+def test_status_phase_ignores_unicode_case_folds() -> None:
+    assert status._phase_from_text("All ſystems operational") == "operational"
+    assert status._phase_from_text("operatİonal") == "unknown"
+    assert status._phase_from_text("MAJOR OUTAGE, KKelvin") == "major_outage"
+
+
 @pytest.mark.asyncio
 async def test_tweets_returns_only_new_items() -> None:
     fetcher = FakeFetcher(
@@ -90,6 +173,14 @@ async def test_tweets_returns_only_new_items() -> None:
     assert "new tweet" in result.events[0].summary
 
 
+def test_tweet_id_accepts_only_plain_digits() -> None:
+    assert tweets._tweet_id("1890") == 1890
+    assert tweets._tweet_id(1890) == 1890
+    assert tweets._tweet_id(" 123 ") == 123
+    for value in ("1_000", "+5", "-5", "²", "", None, True, -3):
+        assert tweets._tweet_id(value) is None
+
+
 @pytest.mark.asyncio
 async def test_github_docs_detects_new_commits() -> None:
     fetcher = FakeFetcher(
@@ -119,6 +210,51 @@ async def test_github_docs_detects_new_commits() -> None:
     assert "Update docs" in result.events[0].summary
 
 
+@pytest.mark.asyncio
+async def test_github_docs_keeps_commit_order() -> None:
+    fetcher = FakeFetcher(
+        {
+            "https://api.github.com/repos/xdevplatform/docs/commits?per_page=20": [
+                {"sha": "sha3", "html_url": "https://github.com/commit/sha3"},
+                {"sha": "sha2", "html_url": "https://github.com/commit/sha2"},
+                {"sha": "sha1", "html_url": "https://github.com/commit/sha1"},
+            ],
+            "https://api.github.com/repos/xdevplatform/docs/commits/sha3": {"commit": {"message": "Third"}},
+            "https://api.github.com/repos/xdevplatform/docs/commits/sha2": {"commit": {"message": "Second"}},
+        }
+    )
+    now = datetime.now(UTC)
+
+    result = await check_github_docs(
+        target="x_docs_github",
+        previous_state={"last_commit_sha": "sha1"},
+        fetcher=fetcher,
+        repo="xdevplatform/docs",
+        github_token=None,
+        now=now,
+    )
+    assert [event.summary for event in result.events] == ["Commit: Second", "Commit: Third"]
+    assert result.state_update["last_commit_sha"] == "sha3"
+
+
+@pytest.mark.asyncio
+async def test_github_docs_skips_unchanged_commit_list() -> None:
+    fetcher = FakeFetcher({}, etag='W/"abc"')
+    now = datetime.now(UTC)
+    previous_state = {"last_commit_sha": "oldsha", "commits_etag": 'W/"abc"'}
+
+    result = await check_github_docs(
+        target="x_docs_github",
+        previous_state=previous_state,
+        fetcher=fetcher,
+        repo="xdevplatform/docs",
+        github_token=None,
+        now=now,
+    )
+    assert result.events == []
+    assert result.state_update == {"last_checked": now.isoformat()}
+
+
 @pytest.mark.asyncio
 async def test_sitemap_filters_marketing_noise() -> None:
     fetcher = FakeFetcher(
@@ -155,3 +291,145 @@ async def test_sitemap_filters_marketing_noise() -> None:
     assert len(result.events) == 1
     assert result.events[0].link == "https://twitterapi.io/readme"
     assert "pricing" not in result.state_update["page_lastmods"]
+
+
+@pytest.mark.asyncio
+async def test_sitemap_reports_failed_page_fetch_in_order() -> None:
+    urls = [f"https://example.com/docs/{index}" for index in range(3)]
+    entries = "".join(f"<url><loc>{url}</loc><lastmod>2026-02-08</lastmod></url>" for url in urls)
+    fetcher = FakeFetcher(
+        {
+            "https://example.com/sitemap.xml": f"<urlset>{entries}</urlset>",
+            urls[0]: "<html><head><title>Zero</title></head></html>",
+            urls[2]: "<html><head><title>Two</title></head></html>",
+        }
+    )
+    now = datetime.now(UTC)
+
+    result = await check_sitemap(
+        target="docs_sitemap",
+        sitemap_url="https://example.com/sitemap.xml",
+        previous_state={"page_lastmods": {url: "2026-02-07" for url in urls}, "page_hashes": {}},
+        fetcher=fetcher,
+        now=now,
+        include_patterns=[],
+        exclude_patterns=[],
+    )
+    assert [event.link for event in result.events] == urls
+    assert [event.kind for event in result.events] == [
+        "sitemap_change",
+        "sitemap_change_fetch_failed",
+        "sitemap_change",
+    ]
+    assert sorted(result.state_update["page_hashes"]) == [urls[0], urls[2]]
+
+
+@pytest.mark.asyncio
+async def test_sitemap_rebaselines_legacy_page_hash() -> None:
+    url = "https://example.com/docs/page"
+    fetcher = FakeFetcher(
+        {
+            "https://example.com/sitemap.xml": (
+                f"<urlset><url><loc>{url}</loc><lastmod>2026-02-08</lastmod></url></urlset>"
+            ),
+            url: "<html><head><title>Page</title></head></html>",
+        }
+    )
+
+    result = await check_sitemap(
+        target="docs_sitemap",
+        sitemap_url="https://example.com/sitemap.xml",
+        previous_state={
+            "page_lastmods": {url: "2026-02-07"},
+            "page_hashes": {url: hashlib.sha256(b"Page").hexdigest()},
+        },
+        fetcher=fetcher,
+        now=datetime.now(UTC),
+        include_patterns=[],
+        exclude_patterns=[],
+    )
+    assert result.events == []
+    assert result.state_update["page_hashes"][url].startswith("blake2b:")
+
+
+@pytest.mark.asyncio
+async def test_sitemap_reuses_summary_for_known_revision() -> None:
+    url = "https://example.com/docs/page"
+    fetcher = FakeFetcher(
+        {
+            "https://example.com/sitemap.xml": (
+                f"<urlset><url><loc>{url}</loc><lastmod>2026-02-08</lastmod></url></urlset>"
+            ),
+            url: "<html><head><title>Page</title></head></html>",
+        }
+    )
+    now = datetime.now(UTC)
+
+    first = await check_sitemap(
+        target="docs_sitemap",
+        sitemap_url="https://example.com/sitemap.xml",
+        previous_state={"page_lastmods": {url: "2026-02-07"}},
+        fetcher=fetcher,
+        now=now,
+        include_patterns=[],
+        exclude_patterns=[],
+    )
+    assert [event.kind for event in first.events] == ["sitemap_change"]
+    assert first.state_update["page_summaries"] == {
+        url: {"lastmod": "2026-02-08", "hash": first.state_update["page_hashes"][url]}
+    }
+
+    del fetcher.payloads[url]
+    gone = {"lastmod": "2026-01-01", "hash": "blake2b:0"}
+    second = await check_sitemap(
+        target="docs_sitemap",
+        sitemap_url="https://example.com/sitemap.xml",
+        previous_state={
+            **first.state_update,
+            "page_lastmods": {"https://example.com/other": "2026-02-01"},
+            "page_summaries": {**first.state_update["page_summaries"], "https://example.com/gone": gone},
+        },
+        fetcher=fetcher,
+        now=now,
+        include_patterns=[],
+        exclude_patterns=[],
+    )
+    assert second.events == []
+    assert second.state_update["page_hashes"] == first.state_update["page_hashes"]
+    assert second.state_update["page_summaries"] == first.state_update["page_summaries"]
+
+
+@pytest.mark.asyncio
+async def test_changelog_detects_new_entries_and_rebaselines_legacy_ids() -> None:
+    url = "https://example.com/changelog"
+    fetcher = FakeFetcher({url: "<html><body><p>Release 2.0 shipped</p><p>Release 1.0 shipped</p></body></html>"})
+    now = datetime.now(UTC)
+
+    legacy = await check_changelog(
+        target="x_changelog",
+        url=url,
+        previous_state={"entry_ids": ["a" * 64]},
+        fetcher=fetcher,
+        now=now,
+    )
+    assert legacy.events == []
+
+    fetcher.payloads[url] = "<html><body><p>Release 3.0 shipped</p><p>Release 2.0 shipped</p></body></html>"
+    result = await check_changelog(
+        target="x_changelog",
+        url=url,
+        previous_state=legacy.state_update,
+        fetcher=fetcher,
+        now=now,
+    )
+    assert [event.summary for event in result.events] == ["Release 3.0 shipped"]
+
+    unchanged = await check_changelog(
+        target="x_changelog",
+        url=url,
+        previous_state=result.state_update,
+        fetcher=fetcher,
+        now=now,
+    )
+    assert unchanged.events == []
+    assert unchanged.state_update == {"last_checked": now.isoformat()}
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 from infra_alerts.state import StateStore
@@ -31,3 +32,42 @@ def test_pending_read_write_cycle(tmp_path: Path) -> None:
     loaded = store.load_pending()
     assert len(loaded) == 2
     assert loaded[1]["id"] == "b"
+
+
+def test_load_state_repairs_partial_file(tmp_path: Path) -> None:
+    state_path = tmp_path / "state.json"
+    state_path.write_text(json.dumps({"targets": [], "meta": {"deployed_version": "1.0.0"}}))
+    store = StateStore(str(state_path), str(tmp_path / "pending.json"))
+
+    state = store.load_state()
+    assert state["version"] == 1
+    assert state["targets"] == {}
+    assert list(state["digest"]["changes"]) == []
+    assert state["meta"] == {"deployed_version": "1.0.0"}
+
+
+def test_digest_history_is_bounded_ring(tmp_path: Path) -> None:
+    store = StateStore(str(tmp_path / "state.json"), str(tmp_path / "pending.json"))
+    state = store.load_state()
+    for index in range(1005):
+        state["digest"]["failed_checks"].append({"target": "x_status", "error": str(index)})
+    store.save_state(state)
+
+    failed = store.load_state()["digest"]["failed_checks"]
+    assert len(failed) == 1000
+    assert failed[0]["error"] == "5"
+    assert json.loads((tmp_path / "state.json").read_text())["digest"]["failed_checks"][-1]["error"] == "1004"
+
+
+def test_unchanged_pending_is_not_rewritten(tmp_path: Path) -> None:
+    pending_path = tmp_path / "pending.json"
+    store = StateStore(str(tmp_path / "state.json"), str(pending_path))
+    store.save_pending([{"id": "a"}])
+    written_at = pending_path.stat().st_mtime_ns
+
+    reloaded = StateStore(str(tmp_path / "state.json"), str(pending_path))
+    reloaded.save_pending(reloaded.load_pending())
+    assert pending_path.stat().st_mtime_ns == written_at
+
+    reloaded.save_pending([])
+    assert json.loads(pending_path.read_text()) == []